@@ -1,11 +1,16 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
+import pyarrow as pa
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-import random
-import time
+import functools
+import glob
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+import os
+import zlib
 from datetime import datetime, timedelta
 
 # Set page configuration
@@ -21,14 +26,38 @@ st.set_page_config(
 # =============================================================================
 
 # Machine and facility configurations
-MACHINES = [f'Machine_{i:02d}' for i in range(1, 11)]
-PRODUCTION_LINES = [f'Line_{chr(65+i)}' for i in range(5)]  # Line_A to Line_E
-FACTORY_ZONES = [f'Zone_{i}' for i in range(1, 8)]
-WAREHOUSES = [f'WH_{i:03d}' for i in range(1, 6)]
-SHIPMENTS = [f'SHIP_{i:04d}' for i in range(1000, 1021)]
-TRUCKS = [f'TRUCK_{i:03d}' for i in range(1, 16)]
-SKUS = [f'SKU_{i:04d}' for i in range(2000, 2051)]
-PACKAGES = [f'PKG_{i:06d}' for i in range(500000, 500101)]
+MACHINES = tuple(f'Machine_{i:02d}' for i in range(1, 11))
+PRODUCTION_LINES = tuple(f'Line_{chr(65+i)}' for i in range(5))  # Line_A to Line_E
+FACTORY_ZONES = tuple(f'Zone_{i}' for i in range(1, 8))
+WAREHOUSES = tuple(f'WH_{i:03d}' for i in range(1, 6))
+SHIPMENTS = tuple(f'SHIP_{i:04d}' for i in range(1000, 1021))
+TRUCKS = tuple(f'TRUCK_{i:03d}' for i in range(1, 16))
+SKUS = tuple(f'SKU_{i:04d}' for i in range(2000, 2051))
+PACKAGES = tuple(f'PKG_{i:06d}' for i in range(500000, 500101))
+
+# Shipments tracked in the cold chain data and their round-robin truck assignments
+COLD_CHAIN_SHIPMENTS = SHIPMENTS[:10]
+COLD_CHAIN_TRUCKS = tuple(TRUCKS[i % len(TRUCKS)] for i in range(len(COLD_CHAIN_SHIPMENTS)))
+
+# SKUs tracked in the inventory data and packages monitored for tampering
+INVENTORY_SKUS = SKUS[:25]
+MONITORED_PACKAGES = PACKAGES[:50]
+
+# Filter selectbox options, built once rather than on every rerun
+MACHINE_OPTIONS = ("All Machines", *MACHINES)
+ZONE_OPTIONS = ("All Zones", *FACTORY_ZONES)
+LINE_OPTIONS = ("All Lines", *PRODUCTION_LINES)
+SHIPMENT_OPTIONS = ("All Shipments", *COLD_CHAIN_SHIPMENTS)
+TRUCK_OPTIONS = ("All Trucks", *dict.fromkeys(COLD_CHAIN_TRUCKS))
+WAREHOUSE_OPTIONS = ("All Warehouses", *WAREHOUSES)
+SKU_OPTIONS = ("All SKUs", *INVENTORY_SKUS)
+PACKAGE_OPTIONS = ("All Packages", *MONITORED_PACKAGES[:20])  # Show first 20 for performance
+
+# Known values for low-cardinality status columns
+MACHINE_STATUSES = ('Running', 'Stopped', 'Maintenance', 'Fault')
+HEALTH_LEVELS = ('excellent', 'good', 'warning', 'critical')
+DOOR_STATES = ('closed', 'open')
+SEAL_STATES = ('intact', 'broken')
 
 # GPS coordinates for realistic truck routes
 GPS_ROUTES = [
@@ -43,19 +72,143 @@ GPS_ROUTES = [
     (47.6062, -122.3321),  # Seattle
     (25.7617, -80.1918),   # Miami
 ]
+GPS_LAT = np.array([lat for lat, _ in GPS_ROUTES])
+GPS_LON = np.array([lon for _, lon in GPS_ROUTES])
+
+# Display precision for generated sensor columns, applied once per column
+DECIMALS = {
+    'vibration_rms': 2, 'temperature_C': 1, 'runtime_hours': 1, 'failure_risk_score': 1,
+    'rpm': 0, 'energy_kWh': 2,
+    'humidity_percent': 1, 'co2_ppm': 0, 'aqi': 0, 'noise_db': 1,
+    'availability_percent': 1, 'performance_percent': 1, 'quality_percent': 1, 'oee_percent': 1,
+    'cold_storage_temp': 1, 'humidity': 1, 'gps_lat': 4, 'gps_lon': 4,
+    'temp': 1, 'co2': 0,
+    'stock_level': 0,
+    'tilt_angle': 1, 'light_exposure_lux': 0,
+}
+
+# Shared 7-day timeline at 1-minute resolution; generators stride it to their sampling interval
+BASE_TIMES = pd.date_range(end=pd.Timestamp.now().floor('min'), periods=7 * 24 * 60 + 1, freq='min')
+
+# Seed for the simulated datasets so regenerated data stays reproducible
+RNG_SEED = 42
+
+# Unseeded generator for the live machine panel's draws; rebuilt on every full script rerun
+LIVE_RNG = np.random.default_rng()
+
+# Points kept per plotted series after LTTB downsampling
+PLOT_POINTS = 500
+
+# Points kept across all series of a scatter plot with one series per entity
+SCATTER_POINTS = 10_000
+
+# Time range options in days; None keeps the full 7-day history
+TIME_RANGES = {"Last 24 Hours": 1, "Last 3 Days": 3, "Last 7 Days": None}
+
+# On-disk cache for generated datasets
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '_cache')
+
+# Bump when shared generator code changes the schema of cached datasets
+CACHE_VERSION = 1
+
+# strftime key for cached datasets; they are regenerated when it rolls over ('%Y%m%d%H' for hourly)
+CACHE_PERIOD = '%Y%m%d'
 
 # =============================================================================
 # DATA GENERATION FUNCTIONS
 # =============================================================================
 
-@st.cache_data
+def parquet_cache(name):
+    """Persist a generator's DataFrame as Parquet, keyed by name, cache period and code version
+    
+    Cached frames, including their timeline, are reused across processes
+    until the CACHE_PERIOD key rolls over. The version token hashes
+    CACHE_VERSION with the generator's source once, when the decorator is
+    applied, so editing a generator invalidates its file. Writing a new file
+    removes the older files cached under the same name.
+    """
+    def decorator(func):
+        version = zlib.crc32(f"{CACHE_VERSION}:{inspect.getsource(func)}".encode())
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            path = os.path.join(CACHE_DIR, f"{name}_{datetime.now():{CACHE_PERIOD}}_{version:08x}.parquet")
+            if not os.path.exists(path):
+                os.makedirs(CACHE_DIR, exist_ok=True)
+                # Write to a temporary file first so concurrent sessions never read a partial file
+                tmp_path = f"{path}.{os.getpid()}.tmp"
+                try:
+                    func(*args, **kwargs).to_parquet(tmp_path, engine='pyarrow', compression='snappy')
+                    os.replace(tmp_path, path)
+                finally:
+                    if os.path.exists(tmp_path):
+                        os.remove(tmp_path)
+                for stale_path in glob.glob(os.path.join(CACHE_DIR, f"{name}_[0-9]*.parquet")):
+                    if stale_path != path:
+                        try:
+                            os.remove(stale_path)
+                        except OSError:
+                            pass  # Already removed by another session, or still open for reading
+            return pd.read_parquet(path, engine='pyarrow')
+        return wrapper
+    return decorator
+
+def dataset_rng(name):
+    """Return a seeded random generator with an independent stream per dataset"""
+    return np.random.default_rng([RNG_SEED, zlib.crc32(name.encode())])
+
+def time_features(timestamps):
+    """Return hour of day, a weekday mask and the weekday 06:00-22:00 work-hour mask"""
+    hours = timestamps.hour.values
+    weekday = timestamps.weekday.values < 5
+    return hours, weekday, weekday & (hours >= 6) & (hours <= 22)
+
+def random_events(rng, shape, probability, low, high):
+    """Draw event magnitudes that are uniform(low, high) with the given probability and 0 otherwise"""
+    return np.where(rng.random(shape) < probability, rng.uniform(low, high, shape), 0)
+
+def dictionary_array(codes, values):
+    """Dictionary-encode integer codes with the narrowest index type that fits the values"""
+    index_type = np.int8 if len(values) <= np.iinfo(np.int8).max else np.int16
+    return pa.DictionaryArray.from_arrays(codes.astype(index_type, copy=False), list(values))
+
+def build_frame(timestamps, entity_col, entities, columns, categories=None):
+    """Build a long-format DataFrame from (entity, timestamp) arrays via a single Arrow table
+    
+    Columns listed in `categories` are dictionary-encoded against the given
+    values and may be passed either as labels or as integer codes. Columns in
+    DECIMALS are rounded to their display precision and stored as int32 when
+    whole-valued; other float columns are narrowed to float32.
+    """
+    categories = categories or {}
+    shape = (len(entities), len(timestamps))
+    entity_codes = np.repeat(np.arange(shape[0]), shape[1])
+    arrays = {
+        'timestamp': pa.array(np.tile(timestamps.values, shape[0])),
+        entity_col: dictionary_array(entity_codes, entities),
+    }
+    # 1-D values hold one value per entity and are repeated across time
+    for name, values in columns.items():
+        values = np.asarray(values)
+        if name in DECIMALS:
+            values = np.round(values, DECIMALS[name]).astype(np.int32 if DECIMALS[name] == 0 else np.float32)
+        elif values.dtype.kind == 'f':
+            values = values.astype(np.float32)
+        if values.ndim == 1:
+            values = values[:, None]
+        if name in categories:
+            if values.dtype.kind not in 'iu':
+                values = pd.Categorical(values.ravel(), categories=categories[name]).codes.reshape(values.shape)
+            arrays[name] = dictionary_array(np.broadcast_to(values, shape).ravel(), categories[name])
+        else:
+            arrays[name] = pa.array(np.broadcast_to(values, shape).ravel())
+    return pa.table(arrays).to_pandas(split_blocks=True, self_destruct=True)
+
+@parquet_cache('predictive_maintenance')
 def generate_predictive_maintenance_data():
     """Generate predictive maintenance data for machines"""
-    end_time = datetime.now()
-    start_time = end_time - timedelta(days=7)
-    timestamps = pd.date_range(start=start_time, end=end_time, freq='12T')
-    
-    data = []
+    timestamps = BASE_TIMES[::12]
+    rng = dataset_rng('predictive_maintenance')
     
     # Machine profiles with different health conditions
     machine_profiles = {
@@ -71,128 +224,97 @@ def generate_predictive_maintenance_data():
         'Machine_10': {'health': 'excellent', 'age_months': 9},
     }
     
-    for machine_id in MACHINES:
-        profile = machine_profiles[machine_id]
-        runtime_hours = profile['age_months'] * 30 * 16  # Assuming 16 hours/day operation
-        
-        for timestamp in timestamps:
-            # Base values depending on machine health
-            if profile['health'] == 'excellent':
-                base_vibration = np.random.uniform(2, 6)
-                base_temp = np.random.uniform(45, 65)
-                base_failure_risk = np.random.uniform(5, 15)
-            elif profile['health'] == 'good':
-                base_vibration = np.random.uniform(4, 8)
-                base_temp = np.random.uniform(50, 70)
-                base_failure_risk = np.random.uniform(15, 30)
-            elif profile['health'] == 'warning':
-                base_vibration = np.random.uniform(6, 11)
-                base_temp = np.random.uniform(60, 78)
-                base_failure_risk = np.random.uniform(30, 55)
-            else:  # critical
-                base_vibration = np.random.uniform(9, 15)
-                base_temp = np.random.uniform(70, 85)
-                base_failure_risk = np.random.uniform(55, 85)
-            
-            # Add operational patterns (higher during work hours)
-            hour = timestamp.hour
-            if 6 <= hour <= 22:  # Operating hours
-                operational_factor = 1.0 + 0.2 * np.sin(np.pi * (hour - 6) / 16)
-            else:  # Maintenance/idle time
-                operational_factor = 0.3
-            
-            vibration_rms = base_vibration * operational_factor + np.random.normal(0, 0.5)
-            temperature_C = base_temp * operational_factor + np.random.normal(0, 2)
-            
-            # Failure risk calculation based on thresholds
-            failure_risk_score = base_failure_risk
-            if vibration_rms > 12:
-                failure_risk_score += (vibration_rms - 12) * 5
-            if temperature_C > 80:
-                failure_risk_score += (temperature_C - 80) * 3
-            
-            failure_risk_score = min(100, max(0, failure_risk_score))
-            runtime_hours += 0.2  # Increment runtime
-            
-            data.append({
-                'timestamp': timestamp,
-                'machine_id': machine_id,
-                'vibration_rms': round(vibration_rms, 2),
-                'temperature_C': round(temperature_C, 1),
-                'runtime_hours': round(runtime_hours, 1),
-                'failure_risk_score': round(failure_risk_score, 1),
-                'health_status': profile['health']
-            })
-    
-    return pd.DataFrame(data)
+    # Base value ranges per health condition: (vibration, temperature, failure risk)
+    health_ranges = {
+        'excellent': [(2, 6), (45, 65), (5, 15)],
+        'good': [(4, 8), (50, 70), (15, 30)],
+        'warning': [(6, 11), (60, 78), (30, 55)],
+        'critical': [(9, 15), (70, 85), (55, 85)],
+    }
+    
+    # All machines are simulated at once as (machine, timestamp) arrays
+    health = [machine_profiles[m]['health'] for m in MACHINES]
+    ranges = np.array([health_ranges[h] for h in health], dtype=float)  # (machines, 3, 2)
+    shape = (len(MACHINES), len(timestamps))
+    
+    base_vibration = rng.uniform(ranges[:, 0, :1], ranges[:, 0, 1:], shape)
+    base_temp = rng.uniform(ranges[:, 1, :1], ranges[:, 1, 1:], shape)
+    base_failure_risk = rng.uniform(ranges[:, 2, :1], ranges[:, 2, 1:], shape)
+    
+    # Add operational patterns (higher during work hours, idle/maintenance otherwise)
+    hours, _, _ = time_features(timestamps)
+    operational_factor = np.where(
+        (hours >= 6) & (hours <= 22),
+        1.0 + 0.2 * np.sin(np.pi * (hours - 6) / 16),
+        0.3
+    )
+    
+    vibration_rms = base_vibration * operational_factor + rng.normal(0, 0.5, shape)
+    temperature_C = base_temp * operational_factor + rng.normal(0, 2, shape)
+    
+    # Failure risk calculation based on thresholds
+    failure_risk_score = (base_failure_risk +
+                          np.maximum(vibration_rms - 12, 0) * 5 +
+                          np.maximum(temperature_C - 80, 0) * 3)
+    np.clip(failure_risk_score, 0, 100, out=failure_risk_score)
+    
+    # Runtime grows by 0.2 hours per reading (assuming 16 hours/day operation)
+    initial_runtime = np.array([machine_profiles[m]['age_months'] * 30 * 16 for m in MACHINES])
+    runtime_hours = initial_runtime[:, None] + np.arange(1, shape[1] + 1) * 0.2
+    
+    return build_frame(timestamps, 'machine_id', MACHINES, {
+        'vibration_rms': vibration_rms,
+        'temperature_C': temperature_C,
+        'runtime_hours': runtime_hours,
+        'failure_risk_score': failure_risk_score,
+        'health_status': health
+    }, categories={'health_status': HEALTH_LEVELS})
 
-@st.cache_data
+@parquet_cache('machine_status')
 def generate_machine_status_data():
     """Generate machine status monitoring data"""
-    end_time = datetime.now()
-    start_time = end_time - timedelta(days=7)
-    timestamps = pd.date_range(start=start_time, end=end_time, freq='10T')
+    timestamps = BASE_TIMES[::10]
+    rng = dataset_rng('machine_status')
     
-    data = []
+    shape = (len(MACHINES), len(timestamps))
+    hours, weekday, work_hours = time_features(timestamps)
     
-    for machine_id in MACHINES:
-        for timestamp in timestamps:
-            hour = timestamp.hour
-            day_of_week = timestamp.weekday()
-            
-            # Determine if machine should be running
-            if day_of_week < 5:  # Weekdays
-                if 6 <= hour <= 22:  # Work hours
-                    # 95% chance of running during work hours
-                    is_running = random.random() < 0.95
-                else:  # Off hours
-                    # 10% chance of running (maintenance, night shift)
-                    is_running = random.random() < 0.10
-            else:  # Weekends
-                # 30% chance of running on weekends
-                is_running = random.random() < 0.30
-            
-            if is_running:
-                status = 'Running'
-                rpm = np.random.uniform(1200, 1800) + np.sin(timestamp.hour * np.pi / 12) * 100
-                energy_kWh = np.random.uniform(15, 25) + np.random.normal(0, 2)
-            else:
-                status = 'Stopped'
-                rpm = 0
-                energy_kWh = np.random.uniform(0.5, 2.0)  # Standby power
-            
-            # Add some variability for running machines
-            if status == 'Running':
-                # Occasional maintenance stops
-                if random.random() < 0.02:  # 2% chance
-                    status = 'Maintenance'
-                    rpm = 0
-                    energy_kWh = np.random.uniform(1, 3)
-                
-                # Machine faults
-                elif random.random() < 0.005:  # 0.5% chance
-                    status = 'Fault'
-                    rpm = np.random.uniform(0, 500)
-                    energy_kWh = np.random.uniform(5, 15)
-            
-            data.append({
-                'timestamp': timestamp,
-                'machine_id': machine_id,
-                'rpm': round(rpm, 0),
-                'energy_kWh': round(energy_kWh, 2),
-                'status': status
-            })
-    
-    return pd.DataFrame(data)
+    # Determine if machine should be running:
+    # 95% during weekday work hours, 10% off hours (maintenance, night shift), 30% on weekends
+    running_prob = np.select([work_hours, weekday], [0.95, 0.10], default=0.30)
+    is_running = rng.random(shape) < running_prob
+    
+    # Occasional maintenance stops (2%) and machine faults (0.5%) for running machines
+    maintenance = is_running & (rng.random(shape) < 0.02)
+    fault = is_running & ~maintenance & (rng.random(shape) < 0.005)
+    running = is_running & ~maintenance & ~fault
+    
+    rpm = np.select(
+        [running, fault],
+        [rng.uniform(1200, 1800, shape) + np.sin(hours * np.pi / 12) * 100,
+         rng.uniform(0, 500, shape)],
+        default=0
+    )
+    energy_kWh = np.select(
+        [running, maintenance, fault],
+        [rng.uniform(15, 25, shape) + rng.normal(0, 2, shape),
+         rng.uniform(1, 3, shape),
+         rng.uniform(5, 15, shape)],
+        default=rng.uniform(0.5, 2.0, shape)  # Standby power
+    )
+    status = np.select([running, maintenance, fault], [0, 2, 3], default=1)  # Codes into MACHINE_STATUSES
+    
+    return build_frame(timestamps, 'machine_id', MACHINES, {
+        'rpm': rpm,
+        'energy_kWh': energy_kWh,
+        'status': status
+    }, categories={'status': MACHINE_STATUSES})
 
-@st.cache_data
+@parquet_cache('factory_environment')
 def generate_factory_environment_data():
     """Generate factory environment monitoring data"""
-    end_time = datetime.now()
-    start_time = end_time - timedelta(days=7)
-    timestamps = pd.date_range(start=start_time, end=end_time, freq='15T')
-    
-    data = []
+    timestamps = BASE_TIMES[::15]
+    rng = dataset_rng('factory_environment')
     
     # Zone characteristics
     zone_profiles = {
@@ -205,86 +327,69 @@ def generate_factory_environment_data():
         'Zone_7': {'type': 'Loading Dock', 'base_temp': 26, 'base_co2': 1000},
     }
     
-    for zone_id in FACTORY_ZONES:
-        profile = zone_profiles[zone_id]
-        
-        for timestamp in timestamps:
-            hour = timestamp.hour
-            day_of_week = timestamp.weekday()
-            
-            # Activity level affects environment
-            if day_of_week < 5 and 6 <= hour <= 22:  # Work hours
-                activity_factor = 0.7 + 0.3 * np.sin(np.pi * (hour - 6) / 16)
-            else:
-                activity_factor = 0.2
-            
-            # Temperature
-            external_temp = 15 + 10 * np.sin(2 * np.pi * (hour - 6) / 24)  # Daily cycle
-            temperature_C = (profile['base_temp'] + 
-                           external_temp * 0.1 + 
-                           activity_factor * 5 + 
-                           np.random.normal(0, 1.5))
-            
-            # Humidity (inversely related to temperature)
-            humidity_percent = 60 - (temperature_C - 20) * 1.5 + np.random.normal(0, 5)
-            humidity_percent = np.clip(humidity_percent, 30, 85)
-            
-            # CO2 levels
-            co2_ppm = (profile['base_co2'] + 
-                      activity_factor * 500 + 
-                      np.random.normal(0, 100))
-            
-            # Occasional CO2 spikes
-            if random.random() < 0.03:  # 3% chance
-                co2_ppm += np.random.uniform(300, 800)
-            
-            co2_ppm = max(400, co2_ppm)
-            
-            # Air Quality Index
-            base_aqi = 25
-            if co2_ppm > 1000:
-                aqi_co2_impact = (co2_ppm - 1000) * 0.05
-            else:
-                aqi_co2_impact = 0
-            
-            aqi = base_aqi + aqi_co2_impact + activity_factor * 20 + np.random.normal(0, 10)
-            aqi = max(0, aqi)
-            
-            # Noise levels
-            if profile['type'] in ['Production Floor', 'Assembly Line', 'Loading Dock']:
-                base_noise = 75
-            elif profile['type'] in ['Quality Control', 'Office Area']:
-                base_noise = 45
-            else:
-                base_noise = 55
-            
-            noise_db = base_noise + activity_factor * 15 + np.random.normal(0, 5)
-            
-            # Occasional noise spikes
-            if random.random() < 0.05:  # 5% chance
-                noise_db += np.random.uniform(10, 25)
-            
-            data.append({
-                'timestamp': timestamp,
-                'zone_id': zone_id,
-                'zone_type': profile['type'],
-                'temperature_C': round(temperature_C, 1),
-                'humidity_percent': round(humidity_percent, 1),
-                'co2_ppm': round(co2_ppm, 0),
-                'aqi': round(aqi, 0),
-                'noise_db': round(noise_db, 1)
-            })
-    
-    return pd.DataFrame(data)
+    zone_types = [zone_profiles[z]['type'] for z in FACTORY_ZONES]
+    base_temp = np.array([zone_profiles[z]['base_temp'] for z in FACTORY_ZONES])[:, None]
+    base_co2 = np.array([zone_profiles[z]['base_co2'] for z in FACTORY_ZONES])[:, None]
+    shape = (len(FACTORY_ZONES), len(timestamps))
+    
+    hours, _, work_hours = time_features(timestamps)
+    
+    # Activity level affects environment
+    activity_factor = np.where(
+        work_hours,
+        0.7 + 0.3 * np.sin(np.pi * (hours - 6) / 16),
+        0.2
+    )
+    
+    # Temperature
+    external_temp = 15 + 10 * np.sin(2 * np.pi * (hours - 6) / 24)  # Daily cycle
+    temperature_C = (base_temp + 
+                     external_temp * 0.1 + 
+                     activity_factor * 5 + 
+                     rng.normal(0, 1.5, shape))
+    
+    # Humidity (inversely related to temperature)
+    humidity_percent = 60 - (temperature_C - 20) * 1.5 + rng.normal(0, 5, shape)
+    np.clip(humidity_percent, 30, 85, out=humidity_percent)
+    
+    # CO2 levels
+    co2_ppm = (base_co2 + 
+               activity_factor * 500 + 
+               rng.normal(0, 100, shape))
+    
+    # Occasional CO2 spikes (3% chance)
+    co2_ppm += random_events(rng, shape, 0.03, 300, 800)
+    np.maximum(co2_ppm, 400, out=co2_ppm)
+    
+    # Air Quality Index
+    base_aqi = 25
+    aqi_co2_impact = np.maximum(co2_ppm - 1000, 0) * 0.05
+    aqi = base_aqi + aqi_co2_impact + activity_factor * 20 + rng.normal(0, 10, shape)
+    np.maximum(aqi, 0, out=aqi)
+    
+    # Noise levels
+    noise_levels = {'Production Floor': 75, 'Assembly Line': 75, 'Loading Dock': 75,
+                    'Quality Control': 45, 'Office Area': 45}
+    base_noise = np.array([noise_levels.get(t, 55) for t in zone_types])[:, None]
+    noise_db = base_noise + activity_factor * 15 + rng.normal(0, 5, shape)
+    
+    # Occasional noise spikes (5% chance)
+    noise_db += random_events(rng, shape, 0.05, 10, 25)
+    
+    return build_frame(timestamps, 'zone_id', FACTORY_ZONES, {
+        'zone_type': zone_types,
+        'temperature_C': temperature_C,
+        'humidity_percent': humidity_percent,
+        'co2_ppm': co2_ppm,
+        'aqi': aqi,
+        'noise_db': noise_db
+    }, categories={'zone_type': list(dict.fromkeys(zone_types))})
 
-@st.cache_data
+@parquet_cache('oee')
 def generate_oee_data():
     """Generate Production Line OEE tracking data"""
-    end_time = datetime.now()
-    start_time = end_time - timedelta(days=7)
-    timestamps = pd.date_range(start=start_time, end=end_time, freq='30T')  # Every 30 minutes
-    
-    data = []
+    timestamps = BASE_TIMES[::30]  # Every 30 minutes
+    rng = dataset_rng('oee')
     
     # Production line profiles
     line_profiles = {
@@ -295,477 +400,621 @@ def generate_oee_data():
         'Line_E': {'efficiency': 0.90, 'reliability': 0.92, 'product': 'Textiles'},
     }
     
-    for line_id in PRODUCTION_LINES:
-        profile = line_profiles[line_id]
-        
-        for timestamp in timestamps:
-            hour = timestamp.hour
-            day_of_week = timestamp.weekday()
-            
-            if day_of_week < 5 and 6 <= hour <= 22:  # Work hours
-                # Base performance during work hours
-                base_availability = profile['reliability'] * 100
-                base_performance = profile['efficiency'] * 100
-                base_quality = np.random.uniform(92, 98)
-                
-                # Shift patterns
-                if 6 <= hour <= 14:  # Morning shift (usually best)
-                    shift_factor = 1.0
-                elif 14 <= hour <= 22:  # Evening shift
-                    shift_factor = 0.95
-                else:  # Night shift
-                    shift_factor = 0.90
-                
-            else:  # Off hours/weekends
-                base_availability = np.random.uniform(10, 30)  # Minimal operations
-                base_performance = np.random.uniform(20, 50)
-                base_quality = np.random.uniform(85, 95)
-                shift_factor = 0.8
-            
-            # Add variability
-            availability_percent = base_availability * shift_factor + np.random.normal(0, 3)
-            performance_percent = base_performance * shift_factor + np.random.normal(0, 4)
-            quality_percent = base_quality + np.random.normal(0, 2)
-            
-            # Ensure realistic bounds
-            availability_percent = np.clip(availability_percent, 0, 100)
-            performance_percent = np.clip(performance_percent, 0, 100)
-            quality_percent = np.clip(quality_percent, 70, 100)
-            
-            # Occasional issues
-            if random.random() < 0.05:  # 5% chance of issues
-                availability_percent *= np.random.uniform(0.6, 0.9)
-                performance_percent *= np.random.uniform(0.7, 0.9)
-            
-            if random.random() < 0.02:  # 2% chance of quality issues
-                quality_percent *= np.random.uniform(0.8, 0.95)
-            
-            # Calculate OEE
-            oee_percent = (availability_percent * performance_percent * quality_percent) / 10000
-            
-            data.append({
-                'timestamp': timestamp,
-                'line_id': line_id,
-                'product_type': profile['product'],
-                'availability_percent': round(availability_percent, 1),
-                'performance_percent': round(performance_percent, 1),
-                'quality_percent': round(quality_percent, 1),
-                'oee_percent': round(oee_percent, 1)
-            })
-    
-    return pd.DataFrame(data)
+    products = [line_profiles[l]['product'] for l in PRODUCTION_LINES]
+    reliability = np.array([line_profiles[l]['reliability'] for l in PRODUCTION_LINES])[:, None]
+    efficiency = np.array([line_profiles[l]['efficiency'] for l in PRODUCTION_LINES])[:, None]
+    shape = (len(PRODUCTION_LINES), len(timestamps))
+    
+    hours, _, work_hours = time_features(timestamps)
+    
+    # Base performance during work hours, minimal operations off hours/weekends
+    base_availability = np.where(work_hours, reliability * 100, rng.uniform(10, 30, shape))
+    base_performance = np.where(work_hours, efficiency * 100, rng.uniform(20, 50, shape))
+    base_quality = np.where(work_hours, rng.uniform(92, 98, shape), rng.uniform(85, 95, shape))
+    
+    # Shift patterns: morning shift is usually best, evening slightly worse
+    shift_factor = np.where(
+        work_hours,
+        np.select([hours <= 14, hours <= 22], [1.0, 0.95], default=0.90),
+        0.8
+    )
+    
+    # Add variability
+    availability_percent = base_availability * shift_factor + rng.normal(0, 3, shape)
+    performance_percent = base_performance * shift_factor + rng.normal(0, 4, shape)
+    quality_percent = base_quality + rng.normal(0, 2, shape)
+    
+    # Ensure realistic bounds
+    np.clip(availability_percent, 0, 100, out=availability_percent)
+    np.clip(performance_percent, 0, 100, out=performance_percent)
+    np.clip(quality_percent, 70, 100, out=quality_percent)
+    
+    # Occasional issues (5% chance) and quality issues (2% chance)
+    issues = rng.random(shape) < 0.05
+    availability_percent *= np.where(issues, rng.uniform(0.6, 0.9, shape), 1.0)
+    performance_percent *= np.where(issues, rng.uniform(0.7, 0.9, shape), 1.0)
+    
+    quality_issues = rng.random(shape) < 0.02
+    quality_percent *= np.where(quality_issues, rng.uniform(0.8, 0.95, shape), 1.0)
+    
+    # Calculate OEE
+    oee_percent = (availability_percent * performance_percent * quality_percent) / 10000
+    
+    return build_frame(timestamps, 'line_id', PRODUCTION_LINES, {
+        'product_type': products,
+        'availability_percent': availability_percent,
+        'performance_percent': performance_percent,
+        'quality_percent': quality_percent,
+        'oee_percent': oee_percent
+    }, categories={'product_type': list(dict.fromkeys(products))})
 
-@st.cache_data
+@parquet_cache('cold_chain')
 def generate_cold_chain_data():
     """Generate cold chain monitoring data"""
-    end_time = datetime.now()
-    start_time = end_time - timedelta(days=7)
-    timestamps = pd.date_range(start=start_time, end=end_time, freq='20T')
-    
-    data = []
-    
-    # Shipment types
-    shipment_configs = {
-        'SHIP_1000': {'target_temp': -18, 'tolerance': 2, 'cargo': 'Frozen Foods'},
-        'SHIP_1001': {'target_temp': 4, 'tolerance': 2, 'cargo': 'Dairy Products'},
-        'SHIP_1002': {'target_temp': 2, 'tolerance': 1, 'cargo': 'Vaccines'},
-        'SHIP_1003': {'target_temp': 6, 'tolerance': 3, 'cargo': 'Fresh Produce'},
-        'SHIP_1004': {'target_temp': -15, 'tolerance': 3, 'cargo': 'Ice Cream'},
-        'SHIP_1005': {'target_temp': 3, 'tolerance': 1, 'cargo': 'Blood Products'},
-        'SHIP_1006': {'target_temp': 8, 'tolerance': 2, 'cargo': 'Beverages'},
-        'SHIP_1007': {'target_temp': -20, 'tolerance': 2, 'cargo': 'Medical Samples'},
-        'SHIP_1008': {'target_temp': 5, 'tolerance': 2, 'cargo': 'Meat Products'},
-        'SHIP_1009': {'target_temp': 7, 'tolerance': 3, 'cargo': 'Chemicals'},
-    }
+    timestamps = BASE_TIMES[::20]
+    rng = dataset_rng('cold_chain')
     
-    for i, (shipment_id, config) in enumerate(list(shipment_configs.items())[:10]):
-        truck_id = TRUCKS[i % len(TRUCKS)]
-        route_coords = GPS_ROUTES[i % len(GPS_ROUTES)]
-        
-        for j, timestamp in enumerate(timestamps):
-            # Simulate route progress
-            progress = min(j / len(timestamps), 1.0)
-            
-            # GPS coordinates with route simulation
-            base_lat, base_lon = route_coords
-            gps_lat = base_lat + progress * np.random.uniform(-2, 2) + np.random.normal(0, 0.01)
-            gps_lon = base_lon + progress * np.random.uniform(-2, 2) + np.random.normal(0, 0.01)
-            
-            # Temperature simulation
-            target_temp = config['target_temp']
-            tolerance = config['tolerance']
-            
-            temp_variation = np.random.normal(0, tolerance * 0.5)
-            
-            # External factors
-            hour = timestamp.hour
-            if 12 <= hour <= 16:  # Hot afternoon
-                external_factor = np.random.uniform(0.5, 2.0)
-            elif 2 <= hour <= 6:  # Cold night
-                external_factor = np.random.uniform(-1.0, -0.3)
-            else:
-                external_factor = np.random.uniform(-0.5, 0.5)
-            
-            # Equipment malfunctions
-            if truck_id in ['TRUCK_003', 'TRUCK_007', 'TRUCK_012']:  # Problem trucks
-                if random.random() < 0.08:  # 8% chance of temperature excursion
-                    temp_variation += np.random.uniform(5, 15)
-            elif random.random() < 0.02:  # 2% chance for normal trucks
-                temp_variation += np.random.uniform(3, 10)
-            
-            cold_storage_temp = target_temp + temp_variation + external_factor * 0.3
-            
-            # Humidity
-            humidity = np.random.uniform(60, 85) + np.random.normal(0, 5)
-            humidity = np.clip(humidity, 40, 95)
-            
-            # Door status
-            door_status = 'closed'
-            if progress < 0.05 or progress > 0.95:  # Loading/unloading
-                if random.random() < 0.1:  # 10% chance
-                    door_status = 'open'
-            elif random.random() < 0.01:  # 1% chance during transit
-                door_status = 'open'
-            
-            data.append({
-                'timestamp': timestamp,
-                'shipment_id': shipment_id,
-                'truck_id': truck_id,
-                'cargo_type': config['cargo'],
-                'cold_storage_temp': round(cold_storage_temp, 1),
-                'humidity': round(humidity, 1),
-                'gps_lat': round(gps_lat, 4),
-                'gps_lon': round(gps_lon, 4),
-                'door_status': door_status,
-                'target_temp': target_temp
-            })
-    
-    return pd.DataFrame(data)
+    # Shipment types: one array per parameter, aligned with shipment_ids
+    shipment_ids = COLD_CHAIN_SHIPMENTS
+    cargo_types = ['Frozen Foods', 'Dairy Products', 'Vaccines', 'Fresh Produce', 'Ice Cream',
+                   'Blood Products', 'Beverages', 'Medical Samples', 'Meat Products', 'Chemicals']
+    target_temp = np.array([-18, 4, 2, 6, -15, 3, 8, -20, 5, 7])[:, None]
+    tolerance = np.array([2, 2, 1, 3, 3, 1, 2, 2, 2, 3])[:, None]
+    truck_idx = np.arange(len(shipment_ids)) % len(TRUCKS)
+    route_idx = np.arange(len(shipment_ids)) % len(GPS_ROUTES)
+    shape = (len(shipment_ids), len(timestamps))
+    
+    # Simulate route progress
+    progress = np.minimum(np.arange(shape[1]) / shape[1], 1.0)
+    
+    # GPS coordinates with route simulation
+    gps_lat = (GPS_LAT[route_idx][:, None] + progress * rng.uniform(-2, 2, shape) +
+               rng.normal(0, 0.01, shape))
+    gps_lon = (GPS_LON[route_idx][:, None] + progress * rng.uniform(-2, 2, shape) +
+               rng.normal(0, 0.01, shape))
+    
+    # Temperature simulation
+    temp_variation = rng.normal(0, 1, shape) * tolerance * 0.5
+    
+    # External factors: hot afternoon, cold night, mild otherwise
+    hours, _, _ = time_features(timestamps)
+    hot = (hours >= 12) & (hours <= 16)
+    cold = (hours >= 2) & (hours <= 6)
+    external_low = np.select([hot, cold], [0.5, -1.0], default=-0.5)
+    external_high = np.select([hot, cold], [2.0, -0.3], default=0.5)
+    external_factor = rng.uniform(external_low, external_high, shape)
+    
+    # Equipment malfunctions: 8% chance of temperature excursion for problem trucks, 2% for normal trucks
+    problem_truck = np.isin(truck_idx, [TRUCKS.index(t) for t in ('TRUCK_003', 'TRUCK_007', 'TRUCK_012')])[:, None]
+    temp_variation += random_events(
+        rng, shape,
+        np.where(problem_truck, 0.08, 0.02),
+        np.where(problem_truck, 5, 3),
+        np.where(problem_truck, 15, 10)
+    )
+    
+    cold_storage_temp = target_temp + temp_variation + external_factor * 0.3
+    
+    # Humidity
+    humidity = rng.uniform(60, 85, shape) + rng.normal(0, 5, shape)
+    np.clip(humidity, 40, 95, out=humidity)
+    
+    # Door status: 10% chance open while loading/unloading, 1% during transit
+    loading = (progress < 0.05) | (progress > 0.95)
+    door_open = rng.random(shape) < np.where(loading, 0.1, 0.01)
+    door_status = door_open.astype(np.int8)  # Codes into DOOR_STATES
+    
+    return build_frame(timestamps, 'shipment_id', shipment_ids, {
+        'truck_id': truck_idx,
+        'cargo_type': cargo_types,
+        'cold_storage_temp': cold_storage_temp,
+        'humidity': humidity,
+        'gps_lat': gps_lat,
+        'gps_lon': gps_lon,
+        'door_status': door_status,
+        'target_temp': target_temp
+    }, categories={'truck_id': TRUCKS, 'cargo_type': cargo_types, 'door_status': DOOR_STATES})
 
-@st.cache_data
+@parquet_cache('warehouse_environment')
 def generate_warehouse_environment_data():
     """Generate warehouse environment monitoring data"""
-    end_time = datetime.now()
-    start_time = end_time - timedelta(days=7)
-    timestamps = pd.date_range(start=start_time, end=end_time, freq='15T')
+    timestamps = BASE_TIMES[::15]
+    rng = dataset_rng('warehouse_environment')
     
-    data = []
+    shape = (len(WAREHOUSES), len(timestamps))
+    hours, weekday, _ = time_features(timestamps)
     
-    for warehouse_id in WAREHOUSES:
-        for timestamp in timestamps:
-            hour = timestamp.hour
-            day_of_week = timestamp.weekday()
-            
-            # Activity level
-            if day_of_week < 5 and 6 <= hour <= 18:  # Work hours
-                activity = 0.8
-            elif day_of_week < 5 and 18 <= hour <= 22:  # Evening
-                activity = 0.4
-            else:  # Off hours/weekends
-                activity = 0.1
-            
-            # Temperature
-            base_temp = 20
-            temp = base_temp + activity * 3 + np.random.normal(0, 2)
-            
-            # Humidity
-            humidity = 50 + activity * 10 + np.random.normal(0, 8)
-            humidity = np.clip(humidity, 30, 80)
-            
-            # CO2
-            base_co2 = 450
-            co2 = base_co2 + activity * 600 + np.random.normal(0, 100)
-            
-            # CO2 spikes
-            if random.random() < 0.03:
-                co2 += np.random.uniform(400, 1000)
-            
-            # AQI
-            aqi = 30 + activity * 40
-            if co2 > 1000:
-                aqi += (co2 - 1000) * 0.03
-            aqi += np.random.normal(0, 15)
-            aqi = max(0, aqi)
-            
-            data.append({
-                'timestamp': timestamp,
-                'warehouse_id': warehouse_id,
-                'temp': round(temp, 1),
-                'humidity': round(humidity, 1),
-                'co2': round(co2, 0),
-                'aqi': round(aqi, 0)
-            })
-    
-    return pd.DataFrame(data)
+    # Activity level: work hours, evening, off hours/weekends
+    activity = np.select(
+        [weekday & (hours >= 6) & (hours <= 18), weekday & (hours >= 18) & (hours <= 22)],
+        [0.8, 0.4],
+        default=0.1
+    )
+    
+    # Temperature
+    base_temp = 20
+    temp = base_temp + activity * 3 + rng.normal(0, 2, shape)
+    
+    # Humidity
+    humidity = 50 + activity * 10 + rng.normal(0, 8, shape)
+    np.clip(humidity, 30, 80, out=humidity)
+    
+    # CO2
+    base_co2 = 450
+    co2 = base_co2 + activity * 600 + rng.normal(0, 100, shape)
+    
+    # CO2 spikes
+    co2 += random_events(rng, shape, 0.03, 400, 1000)
+    
+    # AQI
+    aqi = 30 + activity * 40 + np.maximum(co2 - 1000, 0) * 0.03
+    aqi += rng.normal(0, 15, shape)
+    np.maximum(aqi, 0, out=aqi)
+    
+    return build_frame(timestamps, 'warehouse_id', WAREHOUSES, {
+        'temp': temp,
+        'humidity': humidity,
+        'co2': co2,
+        'aqi': aqi
+    })
+
+def simulate_inventory(consumption, reorder_point, initial_stock, restock_ok, restock_amount):
+    """Simulate per-SKU stock levels, restocking whenever stock is at or below the reorder point
+    
+    All random draws are passed in as (sku, hour) arrays; `restock_ok` marks the
+    hours in which a pending restock may arrive. Returns the stock level after
+    each hour and the amount restocked in it.
+    """
+    stock_level = np.empty(consumption.shape)
+    restocks = np.zeros(consumption.shape)
+    for i in range(consumption.shape[0]):
+        level, t = initial_stock[i], 0
+        # Between restocks stock only drains, so each segment is one cumulative sum clamped at zero;
+        # step from restock event to restock event instead of hour by hour
+        while t < consumption.shape[1]:
+            segment = np.maximum(level - np.cumsum(consumption[i, t:]), 0)
+            events = np.flatnonzero((segment <= reorder_point[i]) & restock_ok[i, t:])
+            end = t + (events[0] + 1 if events.size else len(segment))
+            stock_level[i, t:end] = segment[:end - t]
+            if events.size:
+                restocks[i, end - 1] = restock_amount[i, end - 1]
+                stock_level[i, end - 1] += restocks[i, end - 1]
+            level, t = stock_level[i, end - 1], end
+    return stock_level, restocks
 
-@st.cache_data
+@parquet_cache('inventory')
 def generate_inventory_data():
     """Generate inventory level tracking data"""
-    end_time = datetime.now()
-    start_time = end_time - timedelta(days=7)
-    timestamps = pd.date_range(start=start_time, end=end_time, freq='60T')  # Hourly
-    
-    data = []
-    
-    # SKU configurations
-    sku_configs = {}
-    for i, sku_id in enumerate(SKUS[:25]):  # Use first 25 SKUs
-        sku_configs[sku_id] = {
-            'initial_stock': np.random.randint(100, 1000),
-            'reorder_point': np.random.randint(50, 200),
-            'consumption_rate': np.random.uniform(0.5, 5.0),  # Units per hour
-            'warehouse_id': WAREHOUSES[i % len(WAREHOUSES)]
-        }
+    timestamps = BASE_TIMES[::60]  # Hourly
+    rng = dataset_rng('inventory')
     
-    for sku_id, config in sku_configs.items():
-        current_stock = config['initial_stock']
-        warehouse_id = config['warehouse_id']
-        reorder_point = config['reorder_point']
-        
-        for timestamp in timestamps:
-            hour = timestamp.hour
-            day_of_week = timestamp.weekday()
-            
-            # Consumption patterns
-            if day_of_week < 5 and 8 <= hour <= 17:  # Business hours
-                consumption_multiplier = 1.0
-            elif day_of_week < 5:  # Weekday off-hours
-                consumption_multiplier = 0.3
-            else:  # Weekends
-                consumption_multiplier = 0.5
-            
-            # Apply consumption
-            consumption = config['consumption_rate'] * consumption_multiplier + np.random.normal(0, 0.5)
-            consumption = max(0, consumption)
-            current_stock = max(0, current_stock - consumption)
-            
-            # Restocking logic
-            if current_stock <= reorder_point:
-                # Simulate restocking delay
-                if random.random() < 0.1:  # 10% chance per hour of restocking
-                    restock_amount = np.random.randint(200, 800)
-                    current_stock += restock_amount
-                    restock_eta = None
-                else:
-                    restock_eta = np.random.randint(6, 48)  # Hours until restock
-            else:
-                restock_eta = None
-            
-            data.append({
-                'timestamp': timestamp,
-                'sku_id': sku_id,
-                'warehouse_id': warehouse_id,
-                'stock_level': round(current_stock, 0),
-                'reorder_point': reorder_point,
-                'restock_eta': restock_eta
-            })
-    
-    return pd.DataFrame(data)
+    # SKU configurations: one array per parameter for the first 25 SKUs
+    sku_ids = INVENTORY_SKUS
+    initial_stock = rng.integers(100, 1000, len(sku_ids)).astype(float)
+    reorder_point = rng.integers(50, 200, len(sku_ids))
+    consumption_rate = rng.uniform(0.5, 5.0, len(sku_ids))[:, None]  # Units per hour
+    warehouse_idx = np.arange(len(sku_ids)) % len(WAREHOUSES)
+    shape = (len(sku_ids), len(timestamps))
+    
+    hours, weekday, _ = time_features(timestamps)
+    
+    # Consumption patterns: business hours, weekday off-hours, weekends
+    consumption_multiplier = np.select(
+        [weekday & (hours >= 8) & (hours <= 17), weekday],
+        [1.0, 0.3],
+        default=0.5
+    )
+    consumption = consumption_rate * consumption_multiplier + rng.normal(0, 0.5, shape)
+    np.maximum(consumption, 0, out=consumption)
+    
+    # Restocking draws: 10% chance per hour of restocking, otherwise hours until restock
+    restock_roll = rng.random(shape)
+    restock_amount = rng.integers(200, 800, shape)
+    eta_draw = rng.integers(6, 48, shape)
+    
+    # Restocking logic (simulated restocking delay)
+    stock_level, restocks = simulate_inventory(
+        consumption, reorder_point, initial_stock, restock_roll < 0.1, restock_amount
+    )
+    low = stock_level - restocks <= reorder_point[:, None]
+    restock_eta = np.where(low & (restocks == 0), eta_draw, np.nan)
+    
+    return build_frame(timestamps, 'sku_id', sku_ids, {
+        'warehouse_id': warehouse_idx,
+        'stock_level': stock_level,
+        'reorder_point': reorder_point,
+        'restock_eta': restock_eta
+    }, categories={'warehouse_id': WAREHOUSES})
 
-@st.cache_data
+@parquet_cache('package_tamper')
 def generate_package_tamper_data():
     """Generate package tampering detection data"""
-    end_time = datetime.now()
-    start_time = end_time - timedelta(days=7)
-    timestamps = pd.date_range(start=start_time, end=end_time, freq='30T')
+    timestamps = BASE_TIMES[::30]
+    rng = dataset_rng('package_tamper')
     
-    data = []
+    package_ids = MONITORED_PACKAGES
+    shape = (len(package_ids), len(timestamps))
     
-    for package_id in PACKAGES[:50]:  # Use first 50 packages
-        for timestamp in timestamps:
-            # Normal tilt angle (0-15 degrees)
-            tilt_angle = np.random.uniform(0, 10) + np.random.normal(0, 2)
-            
-            # Occasional high tilt events (drops, mishandling)
-            if random.random() < 0.02:  # 2% chance
-                tilt_angle += np.random.uniform(30, 80)
-            
-            tilt_angle = max(0, tilt_angle)
-            
-            # Light exposure (normal: 0-200 lux)
-            light_exposure_lux = np.random.uniform(10, 150) + np.random.normal(0, 20)
-            
-            # Tampering attempts (high light exposure)
-            if random.random() < 0.01:  # 1% chance
-                light_exposure_lux += np.random.uniform(800, 2000)
-            
-            light_exposure_lux = max(0, light_exposure_lux)
-            
-            # Seal status
-            seal_status = 'intact'
-            
-            # Seal failure probability increases with high tilt/light
-            failure_prob = 0.001  # Base 0.1%
-            if tilt_angle > 45:
-                failure_prob += 0.02
-            if light_exposure_lux > 1000:
-                failure_prob += 0.03
-            
-            if random.random() < failure_prob:
-                seal_status = 'broken'
-            
-            data.append({
-                'timestamp': timestamp,
-                'package_id': package_id,
-                'tilt_angle': round(tilt_angle, 1),
-                'light_exposure_lux': round(light_exposure_lux, 0),
-                'seal_status': seal_status
-            })
-    
-    return pd.DataFrame(data)
+    # Normal tilt angle (0-15 degrees)
+    tilt_angle = rng.uniform(0, 10, shape) + rng.normal(0, 2, shape)
+    
+    # Occasional high tilt events (drops, mishandling), 2% chance
+    tilt_angle += random_events(rng, shape, 0.02, 30, 80)
+    np.maximum(tilt_angle, 0, out=tilt_angle)
+    
+    # Light exposure (normal: 0-200 lux)
+    light_exposure_lux = rng.uniform(10, 150, shape) + rng.normal(0, 20, shape)
+    
+    # Tampering attempts (high light exposure), 1% chance
+    light_exposure_lux += random_events(rng, shape, 0.01, 800, 2000)
+    np.maximum(light_exposure_lux, 0, out=light_exposure_lux)
+    
+    # Seal failure probability increases with high tilt/light (base 0.1%)
+    failure_prob = 0.001 + (tilt_angle > 45) * 0.02 + (light_exposure_lux > 1000) * 0.03
+    seal_status = (rng.random(shape) < failure_prob).astype(np.int8)  # Codes into SEAL_STATES
+    
+    return build_frame(timestamps, 'package_id', package_ids, {
+        'tilt_angle': tilt_angle,
+        'light_exposure_lux': light_exposure_lux,
+        'seal_status': seal_status
+    }, categories={'seal_status': SEAL_STATES})
+
+GENERATORS = [
+    generate_predictive_maintenance_data,
+    generate_machine_status_data,
+    generate_factory_environment_data,
+    generate_oee_data,
+    generate_cold_chain_data,
+    generate_warehouse_environment_data,
+    generate_inventory_data,
+    generate_package_tamper_data,
+]
+
+@st.cache_data(show_spinner=False)
+def load_all_data():
+    """Run the independent generators concurrently; NumPy and Arrow release the GIL for the heavy work"""
+    with ThreadPoolExecutor(max_workers=len(GENERATORS)) as executor:
+        return tuple(executor.map(lambda generate: generate(), GENERATORS))
 
 # =============================================================================
 # ALERT CHECKING FUNCTIONS
 # =============================================================================
 
-def check_predictive_maintenance_alerts(df):
-    """Check for predictive maintenance alerts"""
-    alerts = []
-    latest_data = df.groupby('machine_id').last().reset_index()
-    
-    for _, row in latest_data.iterrows():
-        if row['vibration_rms'] > 12:
-            alerts.append({
-                'type': 'High Vibration',
-                'machine': row['machine_id'],
-                'value': row['vibration_rms'],
-                'threshold': 12,
-                'severity': 'Warning'
-            })
-        
-        if row['temperature_C'] > 80:
-            alerts.append({
-                'type': 'High Temperature',
-                'machine': row['machine_id'],
-                'value': row['temperature_C'],
-                'threshold': 80,
-                'severity': 'Critical'
-            })
-        
-        if row['failure_risk_score'] > 70:
-            alerts.append({
-                'type': 'High Failure Risk',
-                'machine': row['machine_id'],
-                'value': row['failure_risk_score'],
-                'threshold': 70,
-                'severity': 'Critical'
-            })
+def latest_readings(df, key, columns=None):
+    """Return the most recent row for each entity in a generated frame or a row filter of one
+    
+    build_frame() lays rows out as one contiguous, time-ordered block per
+    entity, and boolean filters keep that order, so each entity's latest
+    reading is the row where its dictionary code changes. Only the key codes
+    are scanned; no hashing is needed.
+    When `columns` is given, only those columns are taken alongside the key.
+    """
+    codes = df[key].cat.codes.to_numpy()
+    rows = np.flatnonzero(np.diff(codes, append=-1))
+    if columns is None:
+        return df.take(rows)
+    return df.iloc[rows, df.columns.get_indexer([key, *columns])]
+
+def recent_readings(df, key, days):
+    """Return the last `days` days of every entity's readings in a generated frame
+    
+    `df` must be an unfiltered build_frame() output: one contiguous block per
+    entity category, each on the same timeline, which is checked up front.
+    All entities share one timeline, so the window starts at the same offset
+    in each entity's block. The offset is found by searching that timeline
+    once and the rows are taken by position instead of comparing every row.
+    """
+    if days is None:
+        return df
+    n_entities = len(df[key].cat.categories)
+    if not len(df) or len(df) % n_entities:
+        raise ValueError(f"recent_readings() needs an unfiltered generated frame, got {len(df)} rows for {n_entities} {key} values")
+    codes = df[key].cat.codes.to_numpy().reshape(n_entities, -1)
+    blocks = df['timestamp'].to_numpy().reshape(n_entities, -1)
+    timeline = blocks[0]
+    if not ((codes == codes[:, :1]).all() and (blocks == timeline).all() and (np.diff(timeline) > np.timedelta64(0)).all()):
+        raise ValueError(f"recent_readings() needs one time-ordered, time-aligned block per {key}")
+    start = np.searchsorted(timeline, timeline[-1] - np.timedelta64(days, 'D'))
+    return df.take(np.arange(len(df)).reshape(n_entities, -1)[:, start:].ravel())
+
+def matching_rows(df, selections):
+    """Return the rows equal to every selected value, indexing the frame once
     
+    `selections` maps columns to the selected value; None keeps every row.
+    """
+    mask = None
+    for column, value in selections.items():
+        if value is not None:
+            matches = (df[column] == value).to_numpy()
+            mask = matches if mask is None else mask & matches
+    return df if mask is None else df[mask]
+
+# Threshold rules per entity key: (column, threshold, alert type, severity)
+THRESHOLD_RULES = {
+    'machine_id': [
+        ('vibration_rms', 12, 'High Vibration', 'Warning'),
+        ('temperature_C', 80, 'High Temperature', 'Critical'),
+        ('failure_risk_score', 70, 'High Failure Risk', 'Critical'),
+    ],
+    'zone_id': [
+        ('co2_ppm', 1500, 'High CO2', 'Warning'),
+        ('aqi', 100, 'Poor Air Quality', 'Warning'),
+        ('noise_db', 90, 'High Noise', 'Warning'),
+    ],
+    'package_id': [
+        ('tilt_angle', 45, 'High Tilt', 'Warning'),
+        ('light_exposure_lux', 1000, 'High Light Exposure', 'Warning'),
+    ],
+}
+
+def threshold_alerts(df, key, field):
+    """Emit an alert for every latest entity reading above one of its key's THRESHOLD_RULES"""
+    alerts = []
+    latest_data = latest_readings(df, key, [column for column, *_ in THRESHOLD_RULES[key]])
+    entities = latest_data[key].to_numpy()
+    for column, threshold, alert_type, severity in THRESHOLD_RULES[key]:
+        values = latest_data[column].to_numpy()
+        breached = values > threshold
+        alerts.extend({
+            'type': alert_type,
+            field: entity,
+            'value': value,
+            'threshold': threshold,
+            'severity': severity
+        } for entity, value in zip(entities[breached], values[breached]))
     return alerts
 
+def check_predictive_maintenance_alerts(df):
+    """Check for predictive maintenance alerts"""
+    return threshold_alerts(df, 'machine_id', 'machine')
+
 def check_environment_alerts(df):
     """Check for factory environment alerts"""
-    alerts = []
-    latest_data = df.groupby('zone_id').last().reset_index()
-    
-    for _, row in latest_data.iterrows():
-        if row['co2_ppm'] > 1500:
-            alerts.append({
-                'type': 'High CO2',
-                'zone': row['zone_id'],
-                'value': row['co2_ppm'],
-                'threshold': 1500,
-                'severity': 'Warning'
-            })
-        
-        if row['aqi'] > 100:
-            alerts.append({
-                'type': 'Poor Air Quality',
-                'zone': row['zone_id'],
-                'value': row['aqi'],
-                'threshold': 100,
-                'severity': 'Warning'
-            })
-        
-        if row['noise_db'] > 90:
-            alerts.append({
-                'type': 'High Noise',
-                'zone': row['zone_id'],
-                'value': row['noise_db'],
-                'threshold': 90,
-                'severity': 'Warning'
-            })
-    
-    return alerts
+    return threshold_alerts(df, 'zone_id', 'zone')
 
 def check_cold_chain_alerts(df):
     """Check for cold chain alerts"""
-    alerts = []
-    latest_data = df.groupby('shipment_id').last().reset_index()
-    
-    for _, row in latest_data.iterrows():
-        target_temp = row['target_temp']
-        current_temp = row['cold_storage_temp']
-        
-        # Temperature deviation alert
-        if abs(current_temp - target_temp) > 5:
-            alerts.append({
-                'type': 'Temperature Deviation',
-                'shipment': row['shipment_id'],
-                'current': current_temp,
-                'target': target_temp,
-                'severity': 'Critical'
-            })
+    latest_data = latest_readings(df, 'shipment_id', ['cold_storage_temp', 'target_temp'])
+    shipments = latest_data['shipment_id'].to_numpy()
+    current = latest_data['cold_storage_temp'].to_numpy()
+    target = latest_data['target_temp'].to_numpy()
     
-    return alerts
+    # Temperature deviation alert
+    deviating = np.abs(current - target) > 5
+    
+    return [{
+        'type': 'Temperature Deviation',
+        'shipment': shipment,
+        'current': current_temp,
+        'target': target_temp,
+        'severity': 'Critical'
+    } for shipment, current_temp, target_temp in zip(shipments[deviating], current[deviating], target[deviating])]
 
 def check_inventory_alerts(df):
     """Check for inventory alerts"""
-    alerts = []
-    latest_data = df.groupby('sku_id').last().reset_index()
+    latest_data = latest_readings(df, 'sku_id', ['warehouse_id', 'stock_level', 'reorder_point'])
     
     low_stock = latest_data[latest_data['stock_level'] <= latest_data['reorder_point']]
     
-    for _, row in low_stock.iterrows():
-        alerts.append({
-            'type': 'Low Stock',
-            'sku': row['sku_id'],
-            'warehouse': row['warehouse_id'],
-            'stock_level': row['stock_level'],
-            'reorder_point': row['reorder_point'],
-            'severity': 'Warning'
-        })
+    alerts = (
+        low_stock[['sku_id', 'warehouse_id', 'stock_level', 'reorder_point']]
+        .rename(columns={'sku_id': 'sku', 'warehouse_id': 'warehouse'})
+        .to_dict('records')
+    )
+    for alert in alerts:
+        alert['type'] = 'Low Stock'
+        alert['severity'] = 'Warning'
     
     return alerts
 
 def check_tampering_alerts(df):
     """Check for package tampering alerts"""
-    alerts = []
-    latest_data = df.groupby('package_id').last().reset_index()
-    
-    for _, row in latest_data.iterrows():
-        if row['tilt_angle'] > 45:
-            alerts.append({
-                'type': 'High Tilt',
-                'package': row['package_id'],
-                'value': row['tilt_angle'],
-                'threshold': 45,
-                'severity': 'Warning'
-            })
-        
-        if row['light_exposure_lux'] > 1000:
-            alerts.append({
-                'type': 'High Light Exposure',
-                'package': row['package_id'],
-                'value': row['light_exposure_lux'],
-                'threshold': 1000,
-                'severity': 'Warning'
-            })
-        
-        if row['seal_status'] == 'broken':
-            alerts.append({
-                'type': 'Broken Seal',
-                'package': row['package_id'],
-                'status': 'broken',
-                'severity': 'Critical'
-            })
+    alerts = threshold_alerts(df, 'package_id', 'package')
+    latest_data = latest_readings(df, 'package_id', ['seal_status'])
+    
+    # seal_status is dictionary-encoded, so compare integer codes rather than labels
+    seal_status = latest_data['seal_status'].astype(pd.CategoricalDtype(SEAL_STATES))
+    broken = seal_status.cat.codes.to_numpy() == SEAL_STATES.index('broken')
+    alerts.extend({
+        'type': 'Broken Seal',
+        'package': package,
+        'status': 'broken',
+        'severity': 'Critical'
+    } for package in latest_data['package_id'].to_numpy()[broken])
     
     return alerts
 
+def check_all_alerts(predictive_data, environment_data, cold_chain_data, inventory_data, tampering_data):
+    """Run every alert checker once, returning alert lists keyed by category"""
+    return {
+        'Predictive Maintenance': check_predictive_maintenance_alerts(predictive_data),
+        'Environment': check_environment_alerts(environment_data),
+        'Cold Chain': check_cold_chain_alerts(cold_chain_data),
+        'Inventory': check_inventory_alerts(inventory_data),
+        'Tampering': check_tampering_alerts(tampering_data),
+    }
+
+@st.cache_data(show_spinner=False)
+def load_all_alerts():
+    """Check alerts once per generated dataset rather than on every rerun"""
+    (predictive_data, _, environment_data, _,
+     cold_chain_data, _, inventory_data, tampering_data) = load_all_data()
+    return check_all_alerts(predictive_data, environment_data, cold_chain_data, inventory_data, tampering_data)
+
+# Alert field naming the entity each category's alerts are raised for
+ALERT_ENTITY_FIELDS = {
+    'Predictive Maintenance': 'machine',
+    'Environment': 'zone',
+    'Cold Chain': 'shipment',
+    'Inventory': 'sku',
+    'Tampering': 'package',
+}
+
+@st.cache_data(show_spinner=False)
+def load_alerts_by_entity():
+    """Group each category's alerts by entity so tab filters are a dict lookup"""
+    alerts_by_entity = {}
+    for category, category_alerts in load_all_alerts().items():
+        grouped = alerts_by_entity[category] = {}
+        for alert in category_alerts:
+            grouped.setdefault(alert[ALERT_ENTITY_FIELDS[category]], []).append(alert)
+    return alerts_by_entity
+
+# =============================================================================
+# CHART HELPERS
+# =============================================================================
+
+def lttb_indices(x, y, n_out):
+    """Return the indices kept by Largest-Triangle-Three-Buckets downsampling"""
+    n = len(x)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+    
+    # First and last points are always kept; the rest are split into n_out - 2 buckets
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    kept = np.empty(n_out, dtype=int)
+    kept[0], kept[-1] = 0, n - 1
+    for i in range(n_out - 2):
+        start, stop = edges[i], edges[i + 1]
+        following = slice(stop, edges[i + 2]) if i + 2 < len(edges) else slice(n - 1, n)
+        avg_x, avg_y = x[following].mean(), y[following].mean()
+        prev_x, prev_y = x[kept[i]], y[kept[i]]
+        
+        # Keep the point forming the largest triangle with the previous pick and the next bucket's mean
+        area = np.abs((prev_x - avg_x) * (y[start:stop] - prev_y) - (prev_x - x[start:stop]) * (avg_y - prev_y))
+        kept[i + 1] = start + np.argmax(area)
+    return kept
+
+def line(df, **kwargs):
+    """Plotly Express line chart rendered with WebGL instead of SVG"""
+    return px.line(df, render_mode='webgl', **kwargs)
+
+def downsample_lttb(df, y, x='timestamp', group=None, n_out=PLOT_POINTS):
+    """Downsample each series in a long-format DataFrame to at most n_out points for plotting"""
+    x_values = df[x].to_numpy()
+    if x_values.dtype.kind == 'M':
+        x_values = x_values.view('int64')
+    x_values = x_values.astype(float)
+    y_values = df[y].to_numpy(dtype=float)
+    if group is None:
+        positions = [np.arange(len(df))]
+    else:
+        positions = df.groupby(group, observed=True, sort=False).indices.values()
+    kept = [pos[lttb_indices(x_values[pos], y_values[pos], n_out)] for pos in positions]
+    return df.iloc[np.sort(np.concatenate(kept))] if kept else df
+
+def category_counts(values):
+    """Return the categories present in a categorical Series and their counts, from its codes"""
+    counts = np.bincount(values.cat.codes.to_numpy(), minlength=len(values.cat.categories))
+    present = counts > 0
+    return values.cat.categories[present], counts[present]
+
+@st.cache_data(show_spinner=False)
+def trend_chart(_df, data_key, y, color=None, title=None, labels=None, hlines=(), targets=()):
+    """Build a downsampled trend chart as a Plotly figure dict, cached across reruns
+    
+    `_df` is not hashed; `data_key` must identify its rows, i.e. the dataset
+    and the filter selections that produced it. Each entry in `hlines` holds
+    keyword arguments for one add_hline() call. `targets` holds (value, label)
+    pairs drawn together as a single dotted trace across the time range.
+    Callers rebuild the dict with go.Figure() before st.plotly_chart(), which
+    rejects a dict with no traces when the filter matches no rows.
+    """
+    fig = line(downsample_lttb(_df, y, group=color), x='timestamp', y=y, color=color, title=title, labels=labels)
+    for hline in hlines:
+        fig.add_hline(**hline)
+    if targets:
+        # Segments are separated by None gaps so one trace carries every target
+        span = [_df['timestamp'].min(), _df['timestamp'].max(), None]
+        fig.add_trace(go.Scatter(
+            x=span * len(targets),
+            y=[value for target, _ in targets for value in (target, target, None)],
+            text=[text for _, label in targets for text in (label, label, None)],
+            mode='lines',
+            line=dict(color='blue', dash='dot'),
+            opacity=0.7,
+            name='Target',
+            hoverinfo='text'
+        ))
+    return fig.to_dict()
+
+@st.cache_data(show_spinner=False)
+def shipment_map(_positions, data_key):
+    """Build the shipment location map as a Plotly figure dict, cached on data_key like trend_chart()"""
+    fig = px.scatter_mapbox(
+        _positions,
+        lat='gps_lat',
+        lon='gps_lon',
+        color='cold_storage_temp',
+        size='humidity',
+        hover_data=['shipment_id', 'truck_id', 'cargo_type', 'door_status'],
+        title='Current Shipment Locations',
+        mapbox_style='open-street-map',
+        height=500,
+        color_continuous_scale='RdYlBu_r'
+    )
+    fig.update_layout(margin={"r":0,"t":30,"l":0,"b":0})
+    return fig.to_dict()
+
 # =============================================================================
 # MAIN DASHBOARD APPLICATION
 # =============================================================================
 
+@st.fragment(run_every=2)
+def realtime_machine_panel(machines):
+    """Simulate a live status reading per machine, rerunning only this panel every 2 seconds"""
+    # Generate new data point
+    current_time = datetime.now()
+    n_machines = len(machines)
+    
+    # Simple real-time simulation: 90% chance running
+    running = LIVE_RNG.random(n_machines) < 0.9
+    rpm = np.where(running, LIVE_RNG.uniform(1400, 1700, n_machines), 0)
+    energy = np.where(running, LIVE_RNG.uniform(18, 23, n_machines), LIVE_RNG.uniform(0.5, 2.0, n_machines))
+    
+    new_df = pd.DataFrame({
+        'timestamp': current_time,
+        'machine_id': machines,
+        'rpm': np.round(rpm, 0),
+        'energy_kWh': np.round(energy, 2),
+        'status': np.where(running, 'Running', 'Stopped')
+    })
+    
+    # Current status metrics
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        running_count = len(new_df[new_df['status'] == 'Running'])
+        st.metric("Running Machines", running_count)
+    
+    with col2:
+        avg_rpm = new_df[new_df['status'] == 'Running']['rpm'].mean()
+        st.metric("Avg RPM", f"{avg_rpm:.0f}" if not np.isnan(avg_rpm) else "0")
+    
+    with col3:
+        total_energy = new_df['energy_kWh'].sum()
+        st.metric("Total Energy", f"{total_energy:.1f} kWh")
+    
+    with col4:
+        fault_count = len(new_df[new_df['status'] == 'Fault'])
+        st.metric("Faults", fault_count)
+    
+    # Real-time chart
+    fig_realtime = px.bar(
+        new_df,
+        x='machine_id',
+        y='rpm',
+        color='status',
+        title=f'Real-Time Machine Status - {current_time.strftime("%H:%M:%S")}',
+        color_discrete_map={
+            'Running': 'green',
+            'Stopped': 'red',
+            'Maintenance': 'orange',
+            'Fault': 'darkred'
+        }
+    )
+    st.plotly_chart(fig_realtime, use_container_width=True)
+
 def main():
     # Page header
     st.title("🏭 Industrial IoT & Supply Chain Monitoring Dashboard")
@@ -777,45 +1026,35 @@ def main():
     
     # Load all data
     with st.spinner("Loading data..."):
-        predictive_data = generate_predictive_maintenance_data()
-        machine_status_data = generate_machine_status_data()
-        environment_data = generate_factory_environment_data()
-        oee_data = generate_oee_data()
-        cold_chain_data = generate_cold_chain_data()
-        warehouse_env_data = generate_warehouse_environment_data()
-        inventory_data = generate_inventory_data()
-        tampering_data = generate_package_tamper_data()
+        (predictive_data, machine_status_data, environment_data, oee_data,
+         cold_chain_data, warehouse_env_data, inventory_data, tampering_data) = load_all_data()
     
     # Check all alerts
-    pm_alerts = check_predictive_maintenance_alerts(predictive_data)
-    env_alerts = check_environment_alerts(environment_data)
-    cc_alerts = check_cold_chain_alerts(cold_chain_data)
-    inv_alerts = check_inventory_alerts(inventory_data)
-    tamper_alerts = check_tampering_alerts(tampering_data)
+    alerts = load_all_alerts()
+    pm_alerts = alerts['Predictive Maintenance']
+    env_alerts = alerts['Environment']
+    cc_alerts = alerts['Cold Chain']
+    inv_alerts = alerts['Inventory']
+    tamper_alerts = alerts['Tampering']
+    alerts_by_entity = load_alerts_by_entity()
     
     # Alert summary in sidebar
     st.sidebar.subheader("🚨 Alert Summary")
-    total_alerts = len(pm_alerts) + len(env_alerts) + len(cc_alerts) + len(inv_alerts) + len(tamper_alerts)
+    alert_counts = {category: len(category_alerts) for category, category_alerts in alerts.items()}
+    total_alerts = sum(alert_counts.values())
     
     if total_alerts > 0:
         st.sidebar.error(f"**{total_alerts} Active Alerts**")
         
-        alert_types = {
-            'Predictive Maintenance': len(pm_alerts),
-            'Environment': len(env_alerts),
-            'Cold Chain': len(cc_alerts),
-            'Inventory': len(inv_alerts),
-            'Tampering': len(tamper_alerts)
-        }
-        
-        for alert_type, count in alert_types.items():
-            if count > 0:
+        for alert_type, count in alert_counts.items():
+            if count:
                 st.sidebar.warning(f"{alert_type}: {count}")
     else:
         st.sidebar.success("✅ No Active Alerts")
     
-    # Create main tabs
-    tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8 = st.tabs([
+    # Main tabs; st.tabs runs every tab body on each rerun, so a horizontal
+    # radio selects the one tab whose body is rendered
+    tab_names = [
         "🔧 Predictive Maintenance",
         "⚙️ Machine Status",
         "🌡️ Factory Environment",
@@ -824,10 +1063,11 @@ def main():
         "🏪 Warehouse Environment",
         "📦 Inventory Tracking",
         "🔒 Package Security"
-    ])
+    ]
+    active_tab = st.radio("Dashboard", tab_names, horizontal=True, label_visibility="collapsed", key="active_tab")
     
     # Tab 1: Predictive Maintenance
-    with tab1:
+    if active_tab == tab_names[0]:
         st.header("🔧 Predictive Maintenance Dashboard")
         
         # Filters
@@ -835,30 +1075,25 @@ def main():
         with col1:
             selected_machine = st.selectbox(
                 "Select Machine:",
-                ["All Machines"] + MACHINES,
+                MACHINE_OPTIONS,
                 key="pm_machine"
             )
         with col2:
             time_range = st.selectbox(
                 "Time Range:",
-                ["Last 24 Hours", "Last 3 Days", "Last 7 Days"],
+                list(TIME_RANGES),
                 index=2,
                 key="pm_time"
             )
         
         # Filter data
-        if time_range == "Last 24 Hours":
-            filtered_data = predictive_data[predictive_data['timestamp'] >= predictive_data['timestamp'].max() - timedelta(days=1)]
-        elif time_range == "Last 3 Days":
-            filtered_data = predictive_data[predictive_data['timestamp'] >= predictive_data['timestamp'].max() - timedelta(days=3)]
-        else:
-            filtered_data = predictive_data
+        filtered_data = recent_readings(predictive_data, 'machine_id', TIME_RANGES[time_range])
         
         if selected_machine != "All Machines":
             filtered_data = filtered_data[filtered_data['machine_id'] == selected_machine]
         
         # Alert banners
-        current_pm_alerts = [a for a in pm_alerts if selected_machine == "All Machines" or a['machine'] == selected_machine]
+        current_pm_alerts = pm_alerts if selected_machine == "All Machines" else alerts_by_entity['Predictive Maintenance'].get(selected_machine, [])
         if current_pm_alerts:
             st.error(f"🚨 {len(current_pm_alerts)} Predictive Maintenance Alerts")
             for alert in current_pm_alerts[:3]:
@@ -868,7 +1103,7 @@ def main():
                     st.warning(f"**{alert['machine']}**: {alert['type']} = {alert['value']} (threshold: {alert['threshold']})")
         
         # KPIs
-        latest_data = filtered_data.groupby('machine_id').last().reset_index()
+        latest_data = latest_readings(filtered_data, 'machine_id')
         
         col1, col2, col3, col4 = st.columns(4)
         with col1:
@@ -892,40 +1127,32 @@ def main():
         
         with col1:
             # Vibration trend
-            fig_vib = px.line(
-                filtered_data,
-                x='timestamp',
+            fig_vib = trend_chart(
+                filtered_data, ('predictive_maintenance', time_range, selected_machine),
                 y='vibration_rms',
                 color='machine_id',
                 title='Vibration RMS Trend',
-                labels={'vibration_rms': 'Vibration (mm/s)'}
+                labels={'vibration_rms': 'Vibration (mm/s)'},
+                hlines=[dict(y=12, line_dash="dash", line_color="red", annotation_text="Alert Threshold")]
             )
-            fig_vib.add_hline(y=12, line_dash="dash", line_color="red", annotation_text="Alert Threshold")
-            st.plotly_chart(fig_vib, use_container_width=True)
+            st.plotly_chart(go.Figure(fig_vib), use_container_width=True)
         
         with col2:
             # Temperature trend
-            fig_temp = px.line(
-                filtered_data,
-                x='timestamp',
+            fig_temp = trend_chart(
+                filtered_data, ('predictive_maintenance', time_range, selected_machine),
                 y='temperature_C',
                 color='machine_id',
                 title='Temperature Trend',
-                labels={'temperature_C': 'Temperature (°C)'}
+                labels={'temperature_C': 'Temperature (°C)'},
+                hlines=[dict(y=80, line_dash="dash", line_color="red", annotation_text="Alert Threshold")]
             )
-            fig_temp.add_hline(y=80, line_dash="dash", line_color="red", annotation_text="Alert Threshold")
-            st.plotly_chart(fig_temp, use_container_width=True)
+            st.plotly_chart(go.Figure(fig_temp), use_container_width=True)
         
         # Failure risk heatmap
         if selected_machine == "All Machines":
-            latest_pivot = latest_data.pivot_table(
-                values='failure_risk_score',
-                index='machine_id',
-                aggfunc='mean'
-            ).reset_index()
-            
             fig_risk = px.bar(
-                latest_pivot,
+                latest_data,
                 x='machine_id',
                 y='failure_risk_score',
                 title='Current Failure Risk Scores by Machine',
@@ -941,24 +1168,17 @@ def main():
         health_df.columns = ['Machine', 'Vibration (mm/s)', 'Temperature (°C)', 'Failure Risk (%)', 'Status']
         
         # Color coding
-        def highlight_status(row):
-            colors = []
-            for col in row.index:
-                if col == 'Failure Risk (%)':
-                    if row[col] > 70:
-                        colors.append('background-color: #ffcccc')
-                    elif row[col] > 50:
-                        colors.append('background-color: #fff2cc')
-                    else:
-                        colors.append('background-color: #ccffcc')
-                else:
-                    colors.append('')
-            return colors
+        def highlight_risk(risk):
+            return np.select(
+                [risk > 70, risk > 50],
+                ['background-color: #ffcccc', 'background-color: #fff2cc'],
+                'background-color: #ccffcc'
+            )
         
-        st.dataframe(health_df.style.apply(highlight_status, axis=1), use_container_width=True)
+        st.dataframe(health_df.style.apply(highlight_risk, subset=['Failure Risk (%)']), use_container_width=True)
     
     # Tab 2: Machine Status Monitoring
-    with tab2:
+    if active_tab == tab_names[1]:
         st.header("⚙️ Machine Status Monitoring")
         
         # Real-time toggle
@@ -969,7 +1189,7 @@ def main():
         with col1:
             selected_machine_status = st.selectbox(
                 "Select Machine:",
-                ["All Machines"] + MACHINES,
+                MACHINE_OPTIONS,
                 key="status_machine"
             )
         with col2:
@@ -980,83 +1200,18 @@ def main():
             )
         
         # Filter data
-        filtered_status = machine_status_data.copy()
-        if selected_machine_status != "All Machines":
-            filtered_status = filtered_status[filtered_status['machine_id'] == selected_machine_status]
-        if status_filter != "All":
-            filtered_status = filtered_status[filtered_status['status'] == status_filter]
+        filtered_status = matching_rows(machine_status_data, {
+            'machine_id': None if selected_machine_status == "All Machines" else selected_machine_status,
+            'status': None if status_filter == "All" else status_filter,
+        })
         
         # Real-time simulation
         if real_time_enabled:
-            placeholder = st.empty()
-            
-            for _ in range(5):  # 5 updates
-                # Generate new data point
-                current_time = datetime.now()
-                new_data = []
-                
-                for machine_id in (MACHINES if selected_machine_status == "All Machines" else [selected_machine_status]):
-                    # Simple real-time simulation
-                    if random.random() < 0.9:  # 90% chance running
-                        status = 'Running'
-                        rpm = np.random.uniform(1400, 1700)
-                        energy = np.random.uniform(18, 23)
-                    else:
-                        status = 'Stopped'
-                        rpm = 0
-                        energy = np.random.uniform(0.5, 2.0)
-                    
-                    new_data.append({
-                        'timestamp': current_time,
-                        'machine_id': machine_id,
-                        'rpm': round(rpm, 0),
-                        'energy_kWh': round(energy, 2),
-                        'status': status
-                    })
-                
-                new_df = pd.DataFrame(new_data)
-                
-                with placeholder.container():
-                    # Current status metrics
-                    col1, col2, col3, col4 = st.columns(4)
-                    
-                    with col1:
-                        running_count = len(new_df[new_df['status'] == 'Running'])
-                        st.metric("Running Machines", running_count)
-                    
-                    with col2:
-                        avg_rpm = new_df[new_df['status'] == 'Running']['rpm'].mean()
-                        st.metric("Avg RPM", f"{avg_rpm:.0f}" if not np.isnan(avg_rpm) else "0")
-                    
-                    with col3:
-                        total_energy = new_df['energy_kWh'].sum()
-                        st.metric("Total Energy", f"{total_energy:.1f} kWh")
-                    
-                    with col4:
-                        fault_count = len(new_df[new_df['status'] == 'Fault'])
-                        st.metric("Faults", fault_count)
-                    
-                    # Real-time chart
-                    fig_realtime = px.bar(
-                        new_df,
-                        x='machine_id',
-                        y='rpm',
-                        color='status',
-                        title=f'Real-Time Machine Status - {current_time.strftime("%H:%M:%S")}',
-                        color_discrete_map={
-                            'Running': 'green',
-                            'Stopped': 'red',
-                            'Maintenance': 'orange',
-                            'Fault': 'darkred'
-                        }
-                    )
-                    st.plotly_chart(fig_realtime, use_container_width=True)
-                
-                time.sleep(2)  # 2-second updates
+            realtime_machine_panel(MACHINES if selected_machine_status == "All Machines" else [selected_machine_status])
         
         else:
             # Static analysis
-            latest_status = filtered_status.groupby('machine_id').last().reset_index()
+            latest_status = latest_readings(filtered_status, 'machine_id')
             
             # Status overview
             col1, col2, col3, col4 = st.columns(4)
@@ -1082,10 +1237,10 @@ def main():
             
             with col1:
                 # Status distribution
-                status_counts = latest_status['status'].value_counts()
+                status_names, status_counts = category_counts(latest_status['status'])
                 fig_status = px.pie(
-                    values=status_counts.values,
-                    names=status_counts.index,
+                    values=status_counts,
+                    names=status_names,
                     title='Machine Status Distribution'
                 )
                 st.plotly_chart(fig_status, use_container_width=True)
@@ -1103,17 +1258,16 @@ def main():
             
             # RPM trend over time
             recent_data = filtered_status[filtered_status['timestamp'] >= filtered_status['timestamp'].max() - timedelta(hours=6)]
-            fig_rpm = px.line(
-                recent_data,
-                x='timestamp',
+            fig_rpm = trend_chart(
+                recent_data, ('machine_status', selected_machine_status, status_filter),
                 y='rpm',
                 color='machine_id',
                 title='RPM Trend (Last 6 Hours)'
             )
-            st.plotly_chart(fig_rpm, use_container_width=True)
+            st.plotly_chart(go.Figure(fig_rpm), use_container_width=True)
     
     # Tab 3: Factory Environment
-    with tab3:
+    if active_tab == tab_names[2]:
         st.header("🌡️ Factory Environment Monitoring")
         
         # Filters
@@ -1121,7 +1275,7 @@ def main():
         with col1:
             selected_zone = st.selectbox(
                 "Select Zone:",
-                ["All Zones"] + FACTORY_ZONES,
+                ZONE_OPTIONS,
                 key="env_zone"
             )
         with col2:
@@ -1132,19 +1286,19 @@ def main():
             )
         
         # Filter data
-        filtered_env = environment_data.copy()
+        filtered_env = environment_data
         if selected_zone != "All Zones":
             filtered_env = filtered_env[filtered_env['zone_id'] == selected_zone]
         
         # Alert banners
-        current_env_alerts = [a for a in env_alerts if selected_zone == "All Zones" or a['zone'] == selected_zone]
+        current_env_alerts = env_alerts if selected_zone == "All Zones" else alerts_by_entity['Environment'].get(selected_zone, [])
         if current_env_alerts:
             st.warning(f"⚠️ {len(current_env_alerts)} Environment Alerts")
             for alert in current_env_alerts[:3]:
                 st.warning(f"**{alert['zone']}**: {alert['type']} = {alert['value']} (threshold: {alert['threshold']})")
         
         # Environmental KPIs
-        latest_env = filtered_env.groupby('zone_id').last().reset_index()
+        latest_env = latest_readings(filtered_env, 'zone_id')
         
         col1, col2, col3, col4 = st.columns(4)
         with col1:
@@ -1174,23 +1328,21 @@ def main():
             "Noise": "noise_db"
         }
         
-        fig_env = px.line(
-            filtered_env,
-            x='timestamp',
+        # Threshold lines
+        env_thresholds = {
+            "CO2": [dict(y=1500, line_dash="dash", line_color="red", annotation_text="Alert Threshold")],
+            "Air Quality": [dict(y=100, line_dash="dash", line_color="red", annotation_text="Unhealthy Threshold")],
+            "Noise": [dict(y=90, line_dash="dash", line_color="red", annotation_text="Alert Threshold")],
+        }
+        
+        fig_env = trend_chart(
+            filtered_env, ('factory_environment', selected_zone),
             y=metric_mapping[env_metric],
             color='zone_id',
-            title=f'{env_metric} Levels Over Time'
+            title=f'{env_metric} Levels Over Time',
+            hlines=env_thresholds.get(env_metric, [])
         )
-        
-        # Add threshold lines
-        if env_metric == "CO2":
-            fig_env.add_hline(y=1500, line_dash="dash", line_color="red", annotation_text="Alert Threshold")
-        elif env_metric == "Air Quality":
-            fig_env.add_hline(y=100, line_dash="dash", line_color="red", annotation_text="Unhealthy Threshold")
-        elif env_metric == "Noise":
-            fig_env.add_hline(y=90, line_dash="dash", line_color="red", annotation_text="Alert Threshold")
-        
-        st.plotly_chart(fig_env, use_container_width=True)
+        st.plotly_chart(go.Figure(fig_env), use_container_width=True)
         
         # Environmental heatmap
         col1, col2 = st.columns(2)
@@ -1224,23 +1376,17 @@ def main():
         env_table = latest_env[['zone_id', 'zone_type', 'temperature_C', 'co2_ppm', 'aqi', 'noise_db']].copy()
         env_table.columns = ['Zone', 'Type', 'Temp (°C)', 'CO2 (ppm)', 'AQI', 'Noise (dB)']
         
-        def highlight_env(row):
-            colors = []
-            for col in row.index:
-                if col == 'CO2 (ppm)' and row[col] > 1500:
-                    colors.append('background-color: #ffcccc')
-                elif col == 'AQI' and row[col] > 100:
-                    colors.append('background-color: #ffcccc')
-                elif col == 'Noise (dB)' and row[col] > 90:
-                    colors.append('background-color: #ffcccc')
-                else:
-                    colors.append('')
-            return colors
+        def highlight_above(values, threshold):
+            return np.where(values > threshold, 'background-color: #ffcccc', '')
+        
+        env_style = env_table.style
+        for column, threshold in [('CO2 (ppm)', 1500), ('AQI', 100), ('Noise (dB)', 90)]:
+            env_style = env_style.apply(highlight_above, threshold=threshold, subset=[column])
         
-        st.dataframe(env_table.style.apply(highlight_env, axis=1), use_container_width=True)
+        st.dataframe(env_style, use_container_width=True)
     
     # Tab 4: Production OEE
-    with tab4:
+    if active_tab == tab_names[3]:
         st.header("📊 Production Line OEE Tracking")
         
         # Filters
@@ -1248,30 +1394,25 @@ def main():
         with col1:
             selected_line = st.selectbox(
                 "Select Production Line:",
-                ["All Lines"] + PRODUCTION_LINES,
+                LINE_OPTIONS,
                 key="oee_line"
             )
         with col2:
             oee_period = st.selectbox(
                 "Time Period:",
-                ["Last 24 Hours", "Last 3 Days", "Last 7 Days"],
+                list(TIME_RANGES),
                 index=1,
                 key="oee_period"
             )
         
         # Filter data
-        if oee_period == "Last 24 Hours":
-            filtered_oee = oee_data[oee_data['timestamp'] >= oee_data['timestamp'].max() - timedelta(days=1)]
-        elif oee_period == "Last 3 Days":
-            filtered_oee = oee_data[oee_data['timestamp'] >= oee_data['timestamp'].max() - timedelta(days=3)]
-        else:
-            filtered_oee = oee_data
+        filtered_oee = recent_readings(oee_data, 'line_id', TIME_RANGES[oee_period])
         
         if selected_line != "All Lines":
             filtered_oee = filtered_oee[filtered_oee['line_id'] == selected_line]
         
         # OEE KPIs
-        latest_oee = filtered_oee.groupby('line_id').last().reset_index()
+        latest_oee = latest_readings(filtered_oee, 'line_id')
         
         col1, col2, col3, col4 = st.columns(4)
         with col1:
@@ -1292,17 +1433,18 @@ def main():
             st.metric("Avg Quality", f"{avg_quality:.1f}%")
         
         # OEE trend chart
-        fig_oee_trend = px.line(
-            filtered_oee,
-            x='timestamp',
+        fig_oee_trend = trend_chart(
+            filtered_oee, ('oee', oee_period, selected_line),
             y='oee_percent',
             color='line_id',
             title='OEE Trend Over Time',
-            labels={'oee_percent': 'OEE (%)'}
+            labels={'oee_percent': 'OEE (%)'},
+            hlines=[
+                dict(y=80, line_dash="dash", line_color="green", annotation_text="World Class (80%)"),
+                dict(y=60, line_dash="dash", line_color="orange", annotation_text="Acceptable (60%)"),
+            ]
         )
-        fig_oee_trend.add_hline(y=80, line_dash="dash", line_color="green", annotation_text="World Class (80%)")
-        fig_oee_trend.add_hline(y=60, line_dash="dash", line_color="orange", annotation_text="Acceptable (60%)")
-        st.plotly_chart(fig_oee_trend, use_container_width=True)
+        st.plotly_chart(go.Figure(fig_oee_trend), use_container_width=True)
         
         # OEE components breakdown
         col1, col2 = st.columns(2)
@@ -1343,24 +1485,17 @@ def main():
         performance_table = latest_oee[['line_id', 'product_type', 'availability_percent', 'performance_percent', 'quality_percent', 'oee_percent']].copy()
         performance_table.columns = ['Line', 'Product', 'Availability (%)', 'Performance (%)', 'Quality (%)', 'OEE (%)']
         
-        def highlight_oee(row):
-            colors = []
-            for col in row.index:
-                if col == 'OEE (%)':
-                    if row[col] >= 80:
-                        colors.append('background-color: #ccffcc')
-                    elif row[col] >= 60:
-                        colors.append('background-color: #fff2cc')
-                    else:
-                        colors.append('background-color: #ffcccc')
-                else:
-                    colors.append('')
-            return colors
+        def highlight_oee(oee):
+            return np.select(
+                [oee >= 80, oee >= 60],
+                ['background-color: #ccffcc', 'background-color: #fff2cc'],
+                'background-color: #ffcccc'
+            )
         
-        st.dataframe(performance_table.style.apply(highlight_oee, axis=1), use_container_width=True)
+        st.dataframe(performance_table.style.apply(highlight_oee, subset=['OEE (%)']), use_container_width=True)
     
     # Tab 5: Cold Chain Monitoring
-    with tab5:
+    if active_tab == tab_names[4]:
         st.header("🚛 Cold Chain Monitoring")
         
         # Filters
@@ -1368,33 +1503,31 @@ def main():
         with col1:
             selected_shipment = st.selectbox(
                 "Select Shipment:",
-                ["All Shipments"] + [s for s in cold_chain_data['shipment_id'].unique()],
+                SHIPMENT_OPTIONS,
                 key="cc_shipment"
             )
         with col2:
             selected_truck = st.selectbox(
                 "Select Truck:",
-                ["All Trucks"] + [t for t in cold_chain_data['truck_id'].unique()],
+                TRUCK_OPTIONS,
                 key="cc_truck"
             )
         
         # Filter data
-        filtered_cc = cold_chain_data.copy()
-        if selected_shipment != "All Shipments":
-            filtered_cc = filtered_cc[filtered_cc['shipment_id'] == selected_shipment]
-        if selected_truck != "All Trucks":
-            filtered_cc = filtered_cc[filtered_cc['truck_id'] == selected_truck]
+        filtered_cc = matching_rows(cold_chain_data, {
+            'shipment_id': None if selected_shipment == "All Shipments" else selected_shipment,
+            'truck_id': None if selected_truck == "All Trucks" else selected_truck,
+        })
         
         # Cold chain alerts
-        current_cc_alerts = [a for a in cc_alerts 
-                           if (selected_shipment == "All Shipments" or a['shipment'] == selected_shipment)]
+        current_cc_alerts = cc_alerts if selected_shipment == "All Shipments" else alerts_by_entity['Cold Chain'].get(selected_shipment, [])
         if current_cc_alerts:
             st.error(f"🚨 {len(current_cc_alerts)} Cold Chain Temperature Alerts")
             for alert in current_cc_alerts[:3]:
                 st.error(f"**{alert['shipment']}**: Current temp {alert['current']}°C (Target: {alert['target']}°C)")
         
         # Cold chain KPIs
-        latest_cc = filtered_cc.groupby('shipment_id').last().reset_index()
+        latest_cc = latest_readings(filtered_cc, 'shipment_id')
         
         col1, col2, col3, col4 = st.columns(4)
         with col1:
@@ -1406,7 +1539,7 @@ def main():
             st.metric("Avg Temperature", f"{avg_temp:.1f}°C")
         
         with col3:
-            temp_violations = len([a for a in cc_alerts])
+            temp_violations = alert_counts['Cold Chain']
             st.metric("Temp Violations", temp_violations)
         
         with col4:
@@ -1417,100 +1550,75 @@ def main():
         col1, col2 = st.columns(2)
         
         with col1:
-            fig_temp_cc = px.line(
-                filtered_cc,
-                x='timestamp',
+            # Target temperature line for each shipment
+            target_lines = [
+                (target_temp, f"{shipment} target: {target_temp}°C")
+                for shipment, target_temp in zip(latest_cc['shipment_id'], latest_cc['target_temp'])
+            ]
+            fig_temp_cc = trend_chart(
+                filtered_cc, ('cold_chain', selected_shipment, selected_truck),
                 y='cold_storage_temp',
                 color='shipment_id',
                 title='Cold Storage Temperature Monitoring',
-                labels={'cold_storage_temp': 'Temperature (°C)'}
+                labels={'cold_storage_temp': 'Temperature (°C)'},
+                targets=target_lines
             )
-            # Add target temperature lines for each shipment
-            for shipment in filtered_cc['shipment_id'].unique():
-                target_temp = filtered_cc[filtered_cc['shipment_id'] == shipment]['target_temp'].iloc[0]
-                fig_temp_cc.add_hline(
-                    y=target_temp,
-                    line_dash="dot",
-                    line_color="blue",
-                    opacity=0.7,
-                    annotation_text=f"Target: {target_temp}°C"
-                )
-            st.plotly_chart(fig_temp_cc, use_container_width=True)
+            st.plotly_chart(go.Figure(fig_temp_cc), use_container_width=True)
         
         with col2:
-            fig_humidity_cc = px.line(
-                filtered_cc,
-                x='timestamp',
+            fig_humidity_cc = trend_chart(
+                filtered_cc, ('cold_chain', selected_shipment, selected_truck),
                 y='humidity',
                 color='shipment_id',
                 title='Humidity Monitoring',
                 labels={'humidity': 'Humidity (%)'}
             )
-            st.plotly_chart(fig_humidity_cc, use_container_width=True)
+            st.plotly_chart(go.Figure(fig_humidity_cc), use_container_width=True)
         
         # GPS tracking map
         st.subheader("🗺️ Real-Time GPS Tracking")
-        latest_positions = filtered_cc.groupby('shipment_id').last().reset_index()
+        latest_positions = latest_cc
         
         if not latest_positions.empty:
-            fig_map = px.scatter_mapbox(
-                latest_positions,
-                lat='gps_lat',
-                lon='gps_lon',
-                color='cold_storage_temp',
-                size='humidity',
-                hover_data=['shipment_id', 'truck_id', 'cargo_type', 'door_status'],
-                title='Current Shipment Locations',
-                mapbox_style='open-street-map',
-                height=500,
-                color_continuous_scale='RdYlBu_r'
-            )
-            fig_map.update_layout(margin={"r":0,"t":30,"l":0,"b":0})
-            st.plotly_chart(fig_map, use_container_width=True)
+            fig_map = shipment_map(latest_positions, ('cold_chain', selected_shipment, selected_truck))
+            st.plotly_chart(go.Figure(fig_map), use_container_width=True)
         
         # Shipment status table
         st.subheader("Shipment Status Overview")
         shipment_table = latest_positions[['shipment_id', 'truck_id', 'cargo_type', 'cold_storage_temp', 'target_temp', 'humidity', 'door_status']].copy()
         shipment_table.columns = ['Shipment', 'Truck', 'Cargo', 'Current Temp (°C)', 'Target Temp (°C)', 'Humidity (%)', 'Door Status']
         
-        def highlight_temp(row):
-            colors = []
-            for col in row.index:
-                if col == 'Current Temp (°C)':
-                    current = row[col]
-                    target = row['Target Temp (°C)']
-                    if abs(current - target) > 5:
-                        colors.append('background-color: #ffcccc')
-                    elif abs(current - target) > 3:
-                        colors.append('background-color: #fff2cc')
-                    else:
-                        colors.append('background-color: #ccffcc')
-                elif col == 'Door Status' and row[col] == 'open':
-                    colors.append('background-color: #fff2cc')
-                else:
-                    colors.append('')
-            return colors
+        def highlight_temp(table):
+            styles = pd.DataFrame('', index=table.index, columns=table.columns)
+            deviation = (table['Current Temp (°C)'] - table['Target Temp (°C)']).abs()
+            styles['Current Temp (°C)'] = np.select(
+                [deviation > 5, deviation > 3],
+                ['background-color: #ffcccc', 'background-color: #fff2cc'],
+                'background-color: #ccffcc'
+            )
+            styles['Door Status'] = np.where(table['Door Status'] == 'open', 'background-color: #fff2cc', '')
+            return styles
         
-        st.dataframe(shipment_table.style.apply(highlight_temp, axis=1), use_container_width=True)
+        st.dataframe(shipment_table.style.apply(highlight_temp, axis=None), use_container_width=True)
     
     # Tab 6: Warehouse Environment
-    with tab6:
+    if active_tab == tab_names[5]:
         st.header("🏪 Warehouse Environment Monitoring")
         
         # Filters
         selected_warehouse = st.selectbox(
             "Select Warehouse:",
-            ["All Warehouses"] + WAREHOUSES,
+            WAREHOUSE_OPTIONS,
             key="wh_env"
         )
         
         # Filter data
-        filtered_wh = warehouse_env_data.copy()
+        filtered_wh = warehouse_env_data
         if selected_warehouse != "All Warehouses":
             filtered_wh = filtered_wh[filtered_wh['warehouse_id'] == selected_warehouse]
         
         # Warehouse KPIs
-        latest_wh = filtered_wh.groupby('warehouse_id').last().reset_index()
+        latest_wh = latest_readings(filtered_wh, 'warehouse_id')
         
         col1, col2, col3, col4 = st.columns(4)
         with col1:
@@ -1535,27 +1643,25 @@ def main():
         col1, col2 = st.columns(2)
         
         with col1:
-            fig_temp_wh = px.line(
-                filtered_wh,
-                x='timestamp',
+            fig_temp_wh = trend_chart(
+                filtered_wh, ('warehouse_environment', selected_warehouse),
                 y='temp',
                 color='warehouse_id',
                 title='Warehouse Temperature',
                 labels={'temp': 'Temperature (°C)'}
             )
-            st.plotly_chart(fig_temp_wh, use_container_width=True)
+            st.plotly_chart(go.Figure(fig_temp_wh), use_container_width=True)
         
         with col2:
-            fig_co2_wh = px.line(
-                filtered_wh,
-                x='timestamp',
+            fig_co2_wh = trend_chart(
+                filtered_wh, ('warehouse_environment', selected_warehouse),
                 y='co2',
                 color='warehouse_id',
                 title='Warehouse CO2 Levels',
-                labels={'co2': 'CO2 (ppm)'}
+                labels={'co2': 'CO2 (ppm)'},
+                hlines=[dict(y=1500, line_dash="dash", line_color="red", annotation_text="Alert Threshold")]
             )
-            fig_co2_wh.add_hline(y=1500, line_dash="dash", line_color="red", annotation_text="Alert Threshold")
-            st.plotly_chart(fig_co2_wh, use_container_width=True)
+            st.plotly_chart(go.Figure(fig_co2_wh), use_container_width=True)
         
         # Combined environmental metrics
         fig_combined = make_subplots(
@@ -1565,31 +1671,30 @@ def main():
             horizontal_spacing=0.1
         )
         
-        for warehouse in latest_wh['warehouse_id'].unique():
-            wh_data = filtered_wh[filtered_wh['warehouse_id'] == warehouse]
-            
-            fig_combined.add_trace(
-                go.Scatter(x=wh_data['timestamp'], y=wh_data['temp'], name=f'{warehouse} - Temp', showlegend=False),
-                row=1, col=1
-            )
-            fig_combined.add_trace(
-                go.Scatter(x=wh_data['timestamp'], y=wh_data['humidity'], name=f'{warehouse} - Humidity', showlegend=False),
-                row=1, col=2
-            )
-            fig_combined.add_trace(
-                go.Scatter(x=wh_data['timestamp'], y=wh_data['co2'], name=f'{warehouse} - CO2', showlegend=False),
-                row=2, col=1
-            )
-            fig_combined.add_trace(
-                go.Scatter(x=wh_data['timestamp'], y=wh_data['aqi'], name=f'{warehouse} - AQI', showlegend=False),
-                row=2, col=2
-            )
+        # One grouped downsample per metric; each warehouse keeps its color across the panels
+        warehouse_colors = dict(zip(WAREHOUSES, px.colors.qualitative.Plotly))
+        for (row, col), (metric, label) in zip(
+            [(1, 1), (1, 2), (2, 1), (2, 2)],
+            [('temp', 'Temp'), ('humidity', 'Humidity'), ('co2', 'CO2'), ('aqi', 'AQI')]
+        ):
+            points = downsample_lttb(filtered_wh, metric, group='warehouse_id')
+            for warehouse, wh_points in points.groupby('warehouse_id', observed=True, sort=False):
+                fig_combined.add_trace(
+                    go.Scattergl(
+                        x=wh_points['timestamp'],
+                        y=wh_points[metric],
+                        name=f'{warehouse} - {label}',
+                        line=dict(color=warehouse_colors[warehouse]),
+                        showlegend=False
+                    ),
+                    row=row, col=col
+                )
         
         fig_combined.update_layout(height=600, title_text="Warehouse Environmental Monitoring")
         st.plotly_chart(fig_combined, use_container_width=True)
     
     # Tab 7: Inventory Tracking
-    with tab7:
+    if active_tab == tab_names[6]:
         st.header("📦 Inventory Level Tracking")
         
         # Filters
@@ -1597,34 +1702,33 @@ def main():
         with col1:
             selected_sku = st.selectbox(
                 "Select SKU:",
-                ["All SKUs"] + [s for s in inventory_data['sku_id'].unique()],
+                SKU_OPTIONS,
                 key="inv_sku"
             )
         with col2:
             selected_warehouse_inv = st.selectbox(
                 "Select Warehouse:",
-                ["All Warehouses"] + WAREHOUSES,
+                WAREHOUSE_OPTIONS,
                 key="inv_warehouse"
             )
         
         # Filter data
-        filtered_inv = inventory_data.copy()
-        if selected_sku != "All SKUs":
-            filtered_inv = filtered_inv[filtered_inv['sku_id'] == selected_sku]
-        if selected_warehouse_inv != "All Warehouses":
-            filtered_inv = filtered_inv[filtered_inv['warehouse_id'] == selected_warehouse_inv]
+        filtered_inv = matching_rows(inventory_data, {
+            'sku_id': None if selected_sku == "All SKUs" else selected_sku,
+            'warehouse_id': None if selected_warehouse_inv == "All Warehouses" else selected_warehouse_inv,
+        })
         
         # Inventory alerts
-        current_inv_alerts = [a for a in inv_alerts 
-                            if (selected_sku == "All SKUs" or a['sku'] == selected_sku) and
-                               (selected_warehouse_inv == "All Warehouses" or a['warehouse'] == selected_warehouse_inv)]
+        current_inv_alerts = inv_alerts if selected_sku == "All SKUs" else alerts_by_entity['Inventory'].get(selected_sku, [])
+        if selected_warehouse_inv != "All Warehouses":
+            current_inv_alerts = [a for a in current_inv_alerts if a['warehouse'] == selected_warehouse_inv]
         if current_inv_alerts:
             st.warning(f"⚠️ {len(current_inv_alerts)} Low Stock Alerts")
             for alert in current_inv_alerts[:5]:
                 st.warning(f"**{alert['sku']}** at {alert['warehouse']}: {alert['stock_level']} units (reorder at {alert['reorder_point']})")
         
         # Inventory KPIs
-        latest_inv = filtered_inv.groupby('sku_id').last().reset_index()
+        latest_inv = latest_readings(filtered_inv, 'sku_id')
         
         col1, col2, col3, col4 = st.columns(4)
         with col1:
@@ -1648,23 +1752,21 @@ def main():
             # Individual SKU tracking
             sku_data = filtered_inv[filtered_inv['sku_id'] == selected_sku]
             
-            fig_stock_trend = px.line(
-                sku_data,
-                x='timestamp',
+            # Reorder point line
+            reorder_point = sku_data['reorder_point'].iloc[0]
+            fig_stock_trend = trend_chart(
+                sku_data, ('inventory', selected_sku, selected_warehouse_inv),
                 y='stock_level',
                 title=f'Stock Level Trend - {selected_sku}',
-                labels={'stock_level': 'Stock Level (units)'}
+                labels={'stock_level': 'Stock Level (units)'},
+                hlines=[dict(
+                    y=reorder_point,
+                    line_dash="dash",
+                    line_color="red",
+                    annotation_text=f"Reorder Point ({reorder_point})"
+                )]
             )
-            
-            # Add reorder point line
-            reorder_point = sku_data['reorder_point'].iloc[0]
-            fig_stock_trend.add_hline(
-                y=reorder_point,
-                line_dash="dash",
-                line_color="red",
-                annotation_text=f"Reorder Point ({reorder_point})"
-            )
-            st.plotly_chart(fig_stock_trend, use_container_width=True)
+            st.plotly_chart(go.Figure(fig_stock_trend), use_container_width=True)
         
         else:
             # Multi-SKU comparison
@@ -1673,7 +1775,7 @@ def main():
             with col1:
                 # Current stock levels
                 fig_current_stock = px.bar(
-                    latest_inv.head(15),  # Show top 15
+                    latest_inv.nlargest(15, 'stock_level'),
                     x='sku_id',
                     y='stock_level',
                     title='Current Stock Levels (Top 15 SKUs)',
@@ -1683,17 +1785,15 @@ def main():
                 st.plotly_chart(fig_current_stock, use_container_width=True)
             
             with col2:
-                # Stock vs reorder point
-                comparison_data = latest_inv.head(15).copy()
-                comparison_data['reorder_gap'] = comparison_data['stock_level'] - comparison_data['reorder_point']
+                # Stock vs reorder point for the 15 SKUs closest to (or below) it
+                reorder_gap = (latest_inv['stock_level'] - latest_inv['reorder_point']).nsmallest(15)
                 
                 fig_reorder_gap = px.bar(
-                    comparison_data,
-                    x='sku_id',
-                    y='reorder_gap',
-                    color='reorder_gap',
+                    x=latest_inv.loc[reorder_gap.index, 'sku_id'],
+                    y=reorder_gap,
+                    color=reorder_gap,
                     title='Stock vs Reorder Point Gap',
-                    labels={'reorder_gap': 'Units Above/Below Reorder Point'},
+                    labels={'x': 'sku_id', 'y': 'Units Above/Below Reorder Point', 'color': 'Units Above/Below Reorder Point'},
                     color_continuous_scale='RdYlGn'
                 )
                 fig_reorder_gap.update_layout(xaxis_tickangle=-45)
@@ -1711,7 +1811,7 @@ def main():
             st.success("✅ All items are above reorder points")
     
     # Tab 8: Package Security
-    with tab8:
+    if active_tab == tab_names[7]:
         st.header("🔒 Package Tampering Detection")
         
         # Filters
@@ -1719,31 +1819,25 @@ def main():
         with col1:
             selected_package = st.selectbox(
                 "Select Package:",
-                ["All Packages"] + PACKAGES[:20],  # Show first 20 for performance
+                PACKAGE_OPTIONS,
                 key="tamper_package"
             )
         with col2:
             tamper_period = st.selectbox(
                 "Time Period:",
-                ["Last 24 Hours", "Last 3 Days", "Last 7 Days"],
+                list(TIME_RANGES),
                 index=1,
                 key="tamper_period"
             )
         
         # Filter data
-        if tamper_period == "Last 24 Hours":
-            filtered_tamper = tampering_data[tampering_data['timestamp'] >= tampering_data['timestamp'].max() - timedelta(days=1)]
-        elif tamper_period == "Last 3 Days":
-            filtered_tamper = tampering_data[tampering_data['timestamp'] >= tampering_data['timestamp'].max() - timedelta(days=3)]
-        else:
-            filtered_tamper = tampering_data
+        filtered_tamper = recent_readings(tampering_data, 'package_id', TIME_RANGES[tamper_period])
         
         if selected_package != "All Packages":
             filtered_tamper = filtered_tamper[filtered_tamper['package_id'] == selected_package]
         
         # Tampering alerts
-        current_tamper_alerts = [a for a in tamper_alerts 
-                               if selected_package == "All Packages" or a['package'] == selected_package]
+        current_tamper_alerts = tamper_alerts if selected_package == "All Packages" else alerts_by_entity['Tampering'].get(selected_package, [])
         if current_tamper_alerts:
             st.error(f"🚨 {len(current_tamper_alerts)} Package Security Alerts")
             for alert in current_tamper_alerts[:5]:
@@ -1753,7 +1847,10 @@ def main():
                     st.warning(f"**{alert['package']}**: {alert['type']} = {alert['value']} (threshold: {alert['threshold']})")
         
         # Security KPIs
-        latest_tamper = filtered_tamper.groupby('package_id').last().reset_index()
+        latest_tamper = latest_readings(filtered_tamper, 'package_id')
+        high_tilt = latest_tamper['tilt_angle'].to_numpy() > 45
+        high_light = latest_tamper['light_exposure_lux'].to_numpy() > 1000
+        broken_seal = (latest_tamper['seal_status'] == 'broken').to_numpy()
         
         col1, col2, col3, col4 = st.columns(4)
         with col1:
@@ -1761,26 +1858,28 @@ def main():
             st.metric("Monitored Packages", total_packages)
         
         with col2:
-            high_tilt_count = len(latest_tamper[latest_tamper['tilt_angle'] > 45])
+            high_tilt_count = int(high_tilt.sum())
             st.metric("High Tilt Alerts", high_tilt_count)
         
         with col3:
-            high_light_count = len(latest_tamper[latest_tamper['light_exposure_lux'] > 1000])
+            high_light_count = int(high_light.sum())
             st.metric("Light Exposure Alerts", high_light_count)
         
         with col4:
-            broken_seal_count = len(latest_tamper[latest_tamper['seal_status'] == 'broken'])
+            broken_seal_count = int(broken_seal.sum())
             st.metric("Broken Seals", broken_seal_count)
         
-        # Tampering detection charts
+        # Tampering detection charts; the point budget is shared across packages
+        package_points = max(SCATTER_POINTS // max(total_packages, 1), 3)
         col1, col2 = st.columns(2)
         
         with col1:
             fig_tilt = px.scatter(
-                filtered_tamper,
+                downsample_lttb(filtered_tamper, 'tilt_angle', group='package_id', n_out=package_points),
                 x='timestamp',
                 y='tilt_angle',
                 color='package_id',
+                render_mode='webgl',
                 title='Package Tilt Angle Detection',
                 labels={'tilt_angle': 'Tilt Angle (degrees)'}
             )
@@ -1789,10 +1888,11 @@ def main():
         
         with col2:
             fig_light = px.scatter(
-                filtered_tamper,
+                downsample_lttb(filtered_tamper, 'light_exposure_lux', group='package_id', n_out=package_points),
                 x='timestamp',
                 y='light_exposure_lux',
                 color='package_id',
+                render_mode='webgl',
                 title='Light Exposure Detection',
                 labels={'light_exposure_lux': 'Light Exposure (lux)'}
             )
@@ -1804,63 +1904,56 @@ def main():
         
         with col1:
             # Seal status distribution
-            seal_counts = latest_tamper['seal_status'].value_counts()
-            fig_seal = px.pie(
-                values=seal_counts.values,
-                names=seal_counts.index,
-                title='Package Seal Status Distribution',
-                color_discrete_map={'intact': 'green', 'broken': 'red'}
-            )
+            seal_counts = {'intact': total_packages - broken_seal_count, 'broken': broken_seal_count}
+            seal_colors = {'intact': 'green', 'broken': 'red'}
+            seal_states = [state for state, count in seal_counts.items() if count]
+            fig_seal = go.Figure(go.Pie(
+                labels=seal_states,
+                values=[seal_counts[state] for state in seal_states],
+                marker=dict(colors=[seal_colors[state] for state in seal_states])
+            ))
+            fig_seal.update_layout(title='Package Seal Status Distribution')
             st.plotly_chart(fig_seal, use_container_width=True)
         
         with col2:
             # Security risk assessment
-            latest_tamper['risk_score'] = (
-                (latest_tamper['tilt_angle'] > 45).astype(int) * 30 +
-                (latest_tamper['light_exposure_lux'] > 1000).astype(int) * 40 +
-                (latest_tamper['seal_status'] == 'broken').astype(int) * 50
-            )
+            latest_tamper['risk_score'] = high_tilt * 30 + high_light * 40 + broken_seal * 50
             
-            risk_distribution = pd.cut(latest_tamper['risk_score'], 
-                                     bins=[0, 20, 50, 100], 
-                                     labels=['Low', 'Medium', 'High']).value_counts()
+            # Risk levels: Low up to 20, Medium up to 50, High above
+            risk_levels = ['Low', 'Medium', 'High']
+            risk_counts = np.bincount(
+                np.searchsorted([20, 50], latest_tamper['risk_score'].to_numpy()),
+                minlength=len(risk_levels)
+            )
             
             fig_risk = px.bar(
-                x=risk_distribution.index,
-                y=risk_distribution.values,
+                x=risk_levels,
+                y=risk_counts,
                 title='Package Security Risk Distribution',
                 labels={'x': 'Risk Level', 'y': 'Number of Packages'},
-                color=risk_distribution.index,
+                color=risk_levels,
                 color_discrete_map={'Low': 'green', 'Medium': 'orange', 'High': 'red'}
             )
             st.plotly_chart(fig_risk, use_container_width=True)
         
         # Suspected tampering events
         st.subheader("Suspected Tampering Events")
-        suspected_packages = latest_tamper[
-            (latest_tamper['tilt_angle'] > 45) |
-            (latest_tamper['light_exposure_lux'] > 1000) |
-            (latest_tamper['seal_status'] == 'broken')
-        ]
+        suspected = high_tilt | high_light | broken_seal
+        suspected_packages = latest_tamper[suspected]
         
         if not suspected_packages.empty:
             tamper_table = suspected_packages[['package_id', 'tilt_angle', 'light_exposure_lux', 'seal_status']].copy()
             tamper_table.columns = ['Package ID', 'Tilt Angle (°)', 'Light Exposure (lux)', 'Seal Status']
             
-            def highlight_tampering(row):
-                colors = []
-                for col in row.index:
-                    if col == 'Tilt Angle (°)' and row[col] > 45:
-                        colors.append('background-color: #ffcccc')
-                    elif col == 'Light Exposure (lux)' and row[col] > 1000:
-                        colors.append('background-color: #ffcccc')
-                    elif col == 'Seal Status' and row[col] == 'broken':
-                        colors.append('background-color: #ff9999')
-                    else:
-                        colors.append('')
-                return colors
+            # Style from the masks that selected the rows instead of re-testing each cell
+            tamper_styles = pd.DataFrame({
+                'Package ID': '',
+                'Tilt Angle (°)': np.where(high_tilt[suspected], 'background-color: #ffcccc', ''),
+                'Light Exposure (lux)': np.where(high_light[suspected], 'background-color: #ffcccc', ''),
+                'Seal Status': np.where(broken_seal[suspected], 'background-color: #ff9999', ''),
+            }, index=tamper_table.index)
             
-            st.dataframe(tamper_table.style.apply(highlight_tampering, axis=1), use_container_width=True)
+            st.dataframe(tamper_table.style.apply(lambda _: tamper_styles, axis=None), use_container_width=True)
         else:
             st.success("✅ No suspicious tampering activity detected")
 
@@ -0,0 +1,17 @@
+import os
+
+import pytest
+
+AppTest = pytest.importorskip("streamlit.testing.v1").AppTest
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+
+
+def test_cold_chain_filter_matching_no_rows_renders():
+    """A shipment/truck pair with no rows renders empty trend charts instead of raising"""
+    at = AppTest.from_file(APP_PATH, default_timeout=120).run()
+    at.radio(key="active_tab").set_value("🚛 Cold Chain").run()
+    # SHIP_1000 is assigned to TRUCK_001, so this selection matches no rows
+    at.selectbox(key="cc_shipment").set_value("SHIP_1000")
+    at.selectbox(key="cc_truck").set_value("TRUCK_005").run()
+    assert not at.exception